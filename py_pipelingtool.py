@@ -1,36 +1,252 @@
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, simpledialog
+from tkinter import ttk
+from collections import defaultdict
+import contextlib
+import functools
 import json
 import math
+import operator
+import time
 from datetime import datetime
 
+try:
+    import orjson  # Optional: much faster parsing of large design files
+except ImportError:
+    orjson = None
+
+# Quadratic Bezier weights for 21 evenly spaced t values (21 points for smooth curve)
+# Formula: P = (1-t)²P₀ + 2(1-t)tP₁ + t²P₂
+_BEZIER_WEIGHTS = tuple(
+    ((1 - t) * (1 - t), 2 * (1 - t) * t, t * t)
+    for t in (i / 20.0 for i in range(21))
+)
+
+# Normalized offsets in [-0.5, 0.5] for spreading n parallel connections along a block edge
+# (blocks accept at most 15 connections, larger counts fall back to the formula)
+_OFFSET_TABLE = tuple(
+    tuple(i / (n - 1) - 0.5 for i in range(n)) if n > 1 else (0.0,) * n
+    for n in range(16)
+)
+
+def _normalized_offset(connection_index, total_connections):
+    """Position of a connection in [-0.5, 0.5] among parallel connections on an edge"""
+    if total_connections < len(_OFFSET_TABLE):
+        return _OFFSET_TABLE[total_connections][connection_index]
+    return connection_index / (total_connections - 1) - 0.5
+
+# Distance (pixels) within which a click selects a connection line
+CONNECTION_HIT_TOLERANCE = 8
+
+# Channels below this are tracked as bits in a block's used-channel masks; larger
+# numbers can only matter once all of them are taken and are then found by a scan
+_CHANNEL_MASK_BITS = 64
+
+def _channel_bit(channel):
+    """Bit for a channel number in a block's used-channel mask (0 for unmasked numbers)"""
+    if isinstance(channel, float) and channel.is_integer():
+        channel = int(channel)
+    if isinstance(channel, int) and 0 <= channel < _CHANNEL_MASK_BITS:
+        return 1 << channel
+    return 0
+
+def _lowest_free_channel(mask):
+    """Lowest channel number whose bit is clear in a used-channel mask"""
+    # mask + 1 carries through the trailing ones, leaving only the lowest clear bit set in ~mask & (mask + 1)
+    return (~mask & (mask + 1)).bit_length() - 1
+
+def _polyline_near_point(points, px, py, tolerance_sq):
+    """Check if (px, py) is within the tolerance of any segment of a flat [x0, y0, x1, y1, ...] list"""
+    # Same math as FIFOConnection._point_to_line_distance_sq, inlined to avoid a call per segment
+    x1 = points[0]
+    y1 = points[1]
+    for i in range(2, len(points) - 1, 2):
+        x2 = points[i]
+        y2 = points[i + 1]
+        A = px - x1
+        B = py - y1
+        C = x2 - x1
+        D = y2 - y1
+        len_sq = C * C + D * D
+        
+        if len_sq == 0:
+            dx, dy = A, B
+        else:
+            param = (A * C + B * D) / len_sq
+            if param < 0:
+                dx, dy = A, B
+            elif param > 1:
+                dx, dy = px - x2, py - y2
+            else:
+                dx, dy = A - param * C, B - param * D
+        
+        if dx * dx + dy * dy <= tolerance_sq:
+            return True
+        x1 = x2
+        y1 = y2
+    return False
+
+def _read_json_file(filename):
+    """Parse a JSON file, using orjson when it is installed"""
+    with open(filename, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+# One shared encoder for the single-line FIFO entries in exported JSON. Exports stay on
+# the stdlib even with orjson installed: orjson has no separators or ASCII-escaping
+# options, so its output could not match existing files byte for byte
+_FIFO_ENCODER = json.JSONEncoder(separators=(',', ': '))
+
+def _compact_fifo_infos(fifo_infos):
+    """Render the "fifo_infos" section with each connection on its own line"""
+    encode = _FIFO_ENCODER.encode
+    lines = ",\n".join("    " + encode(fifo) for fifo in fifo_infos)
+    return f'  "fifo_infos": [\n{lines}\n  ]\n' if lines else '  "fifo_infos": [\n  ]\n'
+
+class SpatialIndex:
+    """Uniform grid over item bounding boxes for fast point hit-testing"""
+    
+    def __init__(self, cell_size=100):
+        self.cell_size = cell_size
+        self.cells = defaultdict(list)
+        self.entries = {}  # item -> [insertion order, covered cell range, x0, y0, x1, y1]
+        self.next_order = 0
+    
+    def update(self, item, x0, y0, x1, y1):
+        """Insert an item or move it to a new bounding box"""
+        size = self.cell_size
+        cell_range = (int(x0 // size), int(y0 // size), int(x1 // size), int(y1 // size))
+        
+        entry = self.entries.get(item)
+        if entry:
+            if entry[1] == cell_range:
+                # Same cells - only the stored bounds change
+                entry[2:] = (x0, y0, x1, y1)
+                return
+            self._remove_from_cells(item, entry[1])
+            order = entry[0]
+        else:
+            order = self.next_order
+            self.next_order += 1
+        
+        cx0, cy0, cx1, cy1 = cell_range
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                self.cells[(cx, cy)].append(item)
+        self.entries[item] = [order, cell_range, x0, y0, x1, y1]
+    
+    def remove(self, item):
+        """Remove an item from the index"""
+        entry = self.entries.pop(item, None)
+        if entry:
+            self._remove_from_cells(item, entry[1])
+    
+    def _remove_from_cells(self, item, cell_range):
+        cx0, cy0, cx1, cy1 = cell_range
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = self.cells[(cx, cy)]
+                bucket.remove(item)
+                if not bucket:
+                    del self.cells[(cx, cy)]
+    
+    def query_point(self, x, y):
+        """Return items whose bounding box contains (x, y), in insertion order"""
+        size = self.cell_size
+        candidates = self.cells.get((int(x // size), int(y // size)))
+        if not candidates:
+            return []
+        
+        # Test against the stored bounds so only real hits reach per-object code
+        entries = self.entries
+        hits = []
+        for item in candidates:
+            order, _, x0, y0, x1, y1 = entries[item]
+            if x0 <= x <= x1 and y0 <= y <= y1:
+                hits.append((order, item))
+        hits.sort(key=lambda hit: hit[0])
+        return [item for _, item in hits]
+    
+    def clear(self):
+        """Remove all items"""
+        self.cells.clear()
+        self.entries.clear()
+
 class Block:
     """Hardware block with automatic channel management"""
     
-    def __init__(self, canvas, x, y, width=150, height=80, name="Module", number=None):
+    max_connections = 15  # Connections a block accepts, counting both directions
+    
+    __slots__ = (
+        'canvas', 'index', 'x', 'y', 'width', 'height', '_name', '_number',
+        '_display_text', 'connections', 'pair_connections', '_src_mask', '_dst_mask',
+        'id', 'text_id', 'resize_handle_id', 'selected', 'tag',
+        '_bbox', '_handle_bbox',
+    )
+    
+    def __init__(self, canvas, x, y, width=150, height=80, name="Module", number=None, index=None):
         self.canvas = canvas
+        self.index = index  # Optional dict mapping this block's canvas item ids back to the block
         self.x = x
         self.y = y
         self.width = width
         self.height = height
-        self.name = name
-        self.number = number
+        self._display_text = None  # Cached label text, reset when name or number changes
+        self._name = name
+        self._number = number
         self.connections = []
+        self.pair_connections = {}  # other block -> shared list of connections between the two
+        self._src_mask = 0  # Bit N set when source channel N is in use
+        self._dst_mask = 0  # Bit N set when destination channel N is in use
         self.id = None
         self.text_id = None
         self.resize_handle_id = None
         self.selected = False
+        self.tag = f"b{id(self)}"  # Shared by all of this block's canvas items
         self.draw()
     
+    @property
+    def name(self):
+        return self._name
+    
+    @name.setter
+    def name(self, value):
+        self._name = value
+        self._display_text = None
+    
+    @property
+    def number(self):
+        return self._number
+    
+    @number.setter
+    def number(self, value):
+        self._number = value
+        self._display_text = None
+    
+    @property
+    def display_text(self):
+        """Label shown inside the block"""
+        if self._display_text is None:
+            if self._number is not None:
+                self._display_text = f"#{self._number}: {self._name}"
+            else:
+                self._display_text = self._name
+        return self._display_text
+    
     def draw(self):
         """Draw the block on the canvas"""
+        self.update_bounds()
+        
         # Delete existing elements
+        self.remove_from_index()
         if self.id:
             self.canvas.delete(self.id)
         if self.text_id:
             self.canvas.delete(self.text_id)
         if self.resize_handle_id:
             self.canvas.delete(self.resize_handle_id)
+            self.resize_handle_id = None
         
         # Draw block rectangle
         color = "#4CAF50" if self.selected else "#2196F3"
@@ -38,34 +254,53 @@ class Block:
         
         self.id = self.canvas.create_rectangle(
             self.x, self.y, self.x + self.width, self.y + self.height,
-            fill=color, outline=outline_color, width=2, tags="block"
+            fill=color, outline=outline_color, width=2, tags=("block", self.tag)
         )
         
         # Draw text
-        if self.number is not None:
-            display_text = f"#{self.number}: {self.name}"
-        else:
-            display_text = self.name
-            
         self.text_id = self.canvas.create_text(
             self.x + self.width/2, self.y + self.height/2,
-            text=display_text, fill="white", font=("Arial", 12, "bold"), tags="block"
+            text=self.display_text, fill="white", font=("Arial", 12, "bold"), tags=("block", self.tag)
         )
         
         # Draw resize handle for selected blocks
         if self.selected:
-            handle_size = 10
-            handle_x = self.x + self.width - handle_size
-            handle_y = self.y + self.height - handle_size
             self.resize_handle_id = self.canvas.create_rectangle(
-                handle_x, handle_y, handle_x + handle_size, handle_y + handle_size,
-                fill="#FF5722", outline="#D32F2F", width=1, tags="resize_handle"
+                *self._handle_bbox,
+                fill="#FF5722", outline="#D32F2F", width=1, tags=("resize_handle", self.tag)
             )
+        
+        self.update_index()
+    
+    def update_index(self):
+        """Map this block's current canvas items back to the block"""
+        index = self.index
+        if index is not None:
+            index[self.id] = self
+            index[self.text_id] = self
+            if self.resize_handle_id:
+                index[self.resize_handle_id] = self
+    
+    def remove_from_index(self):
+        """Drop this block's canvas items from the item index"""
+        index = self.index
+        if index is not None:
+            index.pop(self.id, None)
+            index.pop(self.text_id, None)
+            index.pop(self.resize_handle_id, None)
+    
+    def update_bounds(self):
+        """Recompute the cached block and resize-handle rectangles"""
+        handle_size = 10
+        x1 = self.x + self.width
+        y1 = self.y + self.height
+        self._bbox = (self.x, self.y, x1, y1)
+        self._handle_bbox = (x1 - handle_size, y1 - handle_size, x1, y1)
     
     def contains_point(self, x, y):
         """Check if point (x, y) is inside this block"""
-        return (self.x <= x <= self.x + self.width and 
-                self.y <= y <= self.y + self.height)
+        x0, y0, x1, y1 = self._bbox
+        return x0 <= x <= x1 and y0 <= y <= y1
     
     def get_connection_point(self, other_block, connection_index=0, total_connections=1):
         """Get the point where connections should attach to this block"""
@@ -88,25 +323,18 @@ class Block:
             if other_block.x < self.x or other_block.x > self.x + self.width:
                 # Horizontal connections - offset vertically
                 offset_range = min(self.height * 0.6, total_connections * 10)
-                step = offset_range / (total_connections - 1) if total_connections > 1 else 0
-                offset = -offset_range/2 + connection_index * step
-                y += offset
+                y += _normalized_offset(connection_index, total_connections) * offset_range
             else:
                 # Vertical connections - offset horizontally
                 offset_range = min(self.width * 0.6, total_connections * 10)
-                step = offset_range / (total_connections - 1) if total_connections > 1 else 0
-                offset = -offset_range/2 + connection_index * step
-                x += offset
+                x += _normalized_offset(connection_index, total_connections) * offset_range
         
         return x, y
     
     def is_resize_handle(self, x, y):
         """Check if point is over the resize handle"""
-        handle_size = 10
-        handle_x = self.x + self.width - handle_size
-        handle_y = self.y + self.height - handle_size
-        return (handle_x <= x <= handle_x + handle_size and 
-                handle_y <= y <= handle_y + handle_size)
+        x0, y0, x1, y1 = self._handle_bbox
+        return x0 <= x <= x1 and y0 <= y <= y1
     
     def move(self, dx, dy):
         """Move the block by the given offset"""
@@ -114,6 +342,13 @@ class Block:
         self.y += dy
         self.draw()
     
+    def translate(self, dx, dy):
+        """Shift the block and all of its canvas items by the given offset"""
+        self.x += dx
+        self.y += dy
+        self.canvas.move(self.tag, dx, dy)
+        self.update_bounds()
+    
     def resize(self, new_width, new_height):
         """Resize the block to new dimensions"""
         self.width = max(50, new_width)
@@ -122,39 +357,73 @@ class Block:
     
     def get_next_available_src_channel(self):
         """Get the next available source channel number for this block"""
-        used_channels = set()
-        for conn in self.connections:
-            if hasattr(conn, 'source_block') and conn.source_block == self:
-                used_channels.add(conn.src_ch_num)
-        
-        # Find the lowest available channel number starting from 0
-        channel_num = 0
-        while channel_num in used_channels:
-            channel_num += 1
-        return channel_num
+        channel = _lowest_free_channel(self._src_mask)
+        if channel >= _CHANNEL_MASK_BITS:
+            used_channels = {conn.src_ch_num for conn in self.connections if conn.source_block is self}
+            while channel in used_channels:
+                channel += 1
+        return channel
     
     def get_next_available_dst_channel(self):
         """Get the next available destination channel number for this block"""
-        used_channels = set()
+        channel = _lowest_free_channel(self._dst_mask)
+        if channel >= _CHANNEL_MASK_BITS:
+            used_channels = {conn.dst_ch_num for conn in self.connections if conn.target_block is self}
+            while channel in used_channels:
+                channel += 1
+        return channel
+    
+    def use_src_channel(self, channel):
+        """Mark a source channel number as used"""
+        self._src_mask |= _channel_bit(channel)
+    
+    def use_dst_channel(self, channel):
+        """Mark a destination channel number as used"""
+        self._dst_mask |= _channel_bit(channel)
+    
+    def refresh_channel_masks(self):
+        """Rebuild the used-channel masks after connections are removed or renumbered"""
+        src_mask = 0
+        dst_mask = 0
         for conn in self.connections:
-            if hasattr(conn, 'target_block') and conn.target_block == self:
-                used_channels.add(conn.dst_ch_num)
-        
-        # Find the lowest available channel number starting from 0
-        channel_num = 0
-        while channel_num in used_channels:
-            channel_num += 1
-        return channel_num
+            if conn.source_block is self:
+                src_mask |= _channel_bit(conn.src_ch_num)
+            if conn.target_block is self:
+                dst_mask |= _channel_bit(conn.dst_ch_num)
+        self._src_mask = src_mask
+        self._dst_mask = dst_mask
     
     def can_add_connection(self):
         """Check if this block can accept more connections (max 15)"""
-        return len(self.connections) < 15
+        return len(self.connections) < self.max_connections
+    
+    def add_connection(self, conn):
+        """Attach a connection to this block"""
+        self.connections.append(conn)
+    
+    def remove_connection(self, conn):
+        """Detach a connection from this block; returns False if it was not attached"""
+        try:
+            self.connections.remove(conn)
+        except ValueError:
+            return False
+        return True
 
 class FIFOConnection:
     """FIFO connection between two blocks with automatic channel assignment"""
     
-    def __init__(self, canvas, source_block, target_block, name="FIFO", depth=16, width=32, src_ch_num=None, dst_ch_num=None):
+    show_labels = True  # Draw FIFO name labels (toggled from the toolbar)
+    deferred_draws = None  # While a dict, draw() only records the connection (see HardwareDesignGUI.batch_redraw)
+    
+    __slots__ = (
+        'canvas', 'index', 'source_block', 'target_block', 'name', 'depth', 'width',
+        'src_ch_num', 'dst_ch_num', 'line_id', 'text_id', 'selected',
+        'curve_points', '_is_curved', '_x1', '_y1', '_x2', '_y2', '_pair_list', '_pair_idx',
+    )
+    
+    def __init__(self, canvas, source_block, target_block, name="FIFO", depth=16, width=32, src_ch_num=None, dst_ch_num=None, index=None):
         self.canvas = canvas
+        self.index = index  # Optional SpatialIndex kept in sync with the line's bounds
         self.source_block = source_block
         self.target_block = target_block
         self.name = name
@@ -163,64 +432,101 @@ class FIFOConnection:
         
         # Auto-assign channel numbers if not specified
         if src_ch_num is None:
-            if hasattr(source_block, 'get_next_available_src_channel'):
-                self.src_ch_num = source_block.get_next_available_src_channel()
-            else:
-                print(f"ERROR: source_block {source_block.name} missing get_next_available_src_channel method")
-                self.src_ch_num = 0
+            self.src_ch_num = source_block.get_next_available_src_channel()
         else:
             self.src_ch_num = src_ch_num
             
         if dst_ch_num is None:
-            if hasattr(target_block, 'get_next_available_dst_channel'):
-                self.dst_ch_num = target_block.get_next_available_dst_channel()
-            else:
-                print(f"ERROR: target_block {target_block.name} missing get_next_available_dst_channel method")
-                self.dst_ch_num = 0
+            self.dst_ch_num = target_block.get_next_available_dst_channel()
         else:
             self.dst_ch_num = dst_ch_num
         
         self.line_id = None
-        self.arrow_id = None
         self.text_id = None
         self.selected = False
         self.curve_points = []  # Store curve points for collision detection
+        self._is_curved = False
+        self._x1 = self._y1 = self._x2 = self._y2 = 0.0  # Endpoints of a straight connection
         
         # Add this connection to both blocks
-        source_block.connections.append(self)
-        target_block.connections.append(self)
+        source_block.add_connection(self)
+        target_block.add_connection(self)
+        
+        # Register with the list of parallel connections shared by this block pair
+        self._pair_list = source_block.pair_connections.setdefault(target_block, [])
+        target_block.pair_connections[source_block] = self._pair_list
+        self._pair_list.append(self)
+        self._pair_idx = len(self._pair_list) - 1
+        
+        source_block.use_src_channel(self.src_ch_num)
+        target_block.use_dst_channel(self.dst_ch_num)
         self.draw()
     
     def draw(self):
         """Draw the FIFO connection on the canvas"""
-        # Delete existing elements
+        if self.deferred_draws is not None:
+            self.deferred_draws[self] = None
+            return
+        
+        points, curved, label_x, label_y = self._compute_geometry()
+        
+        # Connection color
+        color = "#FF5722" if self.selected else "#333"
+        line_width = 3 if self.selected else 2
+        
+        # Draw connection line (straight or curved based on multiple connections)
+        # with Tk's built-in arrowhead at the target end, drawn in the line color
         if self.line_id:
-            self.canvas.delete(self.line_id)
-        if self.arrow_id:
-            self.canvas.delete(self.arrow_id)
-        if self.text_id:
+            # Reuse the existing line; raise it so it stacks as a freshly drawn one would
+            self.canvas.coords(self.line_id, *points)
+            self.canvas.itemconfigure(self.line_id, fill=color, width=line_width, smooth=curved)
+            self.canvas.tag_raise(self.line_id)
+        else:
+            self.line_id = self.canvas.create_line(
+                points, fill=color, width=line_width, smooth=curved,
+                arrow=tk.LAST, arrowshape=(12, 12, 5), tags="connection"
+            )
+        
+        # Draw connection label, reusing the existing text item when there is one
+        if self.show_labels:
+            text_color = "#FF5722" if self.selected else "#000"
+            if self.text_id:
+                self.canvas.coords(self.text_id, label_x, label_y)
+                self.canvas.itemconfigure(self.text_id, text=self.name, fill=text_color)
+                self.canvas.tag_raise(self.text_id, self.line_id)
+            else:
+                self.text_id = self.canvas.create_text(
+                    label_x, label_y, text=self.name, 
+                    fill=text_color, font=("Arial", 9, "bold"), tags="connection"
+                )
+        elif self.text_id:
             self.canvas.delete(self.text_id)
+            self.text_id = None
+    
+    def update_endpoints(self):
+        """Move the existing canvas items to follow the blocks without recreating them"""
+        if not self.line_id:
+            self.draw()
+            return
         
-        # Count connections between these blocks for positioning
-        connections_between = []
-        for conn in self.source_block.connections:
-            if ((conn.source_block == self.source_block and conn.target_block == self.target_block) or
-                (conn.source_block == self.target_block and conn.target_block == self.source_block)):
-                connections_between.append(conn)
+        points, _, label_x, label_y = self._compute_geometry()
         
-        total_connections = len(connections_between)
-        connection_index = connections_between.index(self) if self in connections_between else 0
+        self.canvas.coords(self.line_id, *points)
+        if self.text_id:
+            self.canvas.coords(self.text_id, label_x, label_y)
+    
+    def _compute_geometry(self):
+        """Compute line points and label position for the current block positions"""
+        # Position among the connections between these blocks
+        total_connections = len(self._pair_list)
+        connection_index = self._pair_idx
         
         # Get connection points with offset for multiple connections
         start_x, start_y = self.source_block.get_connection_point(self.target_block, connection_index, total_connections)
         end_x, end_y = self.target_block.get_connection_point(self.source_block, connection_index, total_connections)
         
-        # Connection color
-        color = "#FF5722" if self.selected else "#333"
-        line_width = 3 if self.selected else 2
-        
-        # Draw connection line (straight or curved based on multiple connections)
-        if total_connections > 1 and connection_index > 0:
+        curved = total_connections > 1 and connection_index > 0
+        if curved:
             # Create smooth curved path for multiple connections
             mid_x = (start_x + end_x) / 2
             mid_y = (start_y + end_y) / 2
@@ -239,61 +545,32 @@ class FIFOConnection:
                 curve_x = mid_x + (curve_offset if connection_index % 2 == 1 else -curve_offset)
                 curve_y = mid_y
             
-            # Create smooth curve using quadratic Bezier
-            points = []
-            for i in range(21):  # 21 points for smooth curve
-                t = i / 20.0
-                # Quadratic Bezier formula: P = (1-t)²P₀ + 2(1-t)tP₁ + t²P₂
-                x = (1-t)**2 * start_x + 2*(1-t)*t * curve_x + t**2 * end_x
-                y = (1-t)**2 * start_y + 2*(1-t)*t * curve_y + t**2 * end_y
-                points.extend([x, y])
-            
-            self.line_id = self.canvas.create_line(points, fill=color, width=line_width, smooth=True, tags="connection")
-            
-            # Store curve points for better collision detection
-            self.curve_points = points
-            
+            # Create smooth curve using quadratic Bezier (cached per geometry)
+            points = list(FIFOConnection._sample_bezier(start_x, start_y, curve_x, curve_y, end_x, end_y))
         else:
-            # Draw straight line for single connections
-            self.line_id = self.canvas.create_line(start_x, start_y, end_x, end_y, fill=color, width=line_width, tags="connection")
-            self.curve_points = [start_x, start_y, end_x, end_y]
-        
-        # Draw arrowhead
-        arrow_color = "#FF5722" if self.selected else "#666"
-        dx = end_x - start_x
-        dy = end_y - start_y
-        length = math.sqrt(dx*dx + dy*dy)
-        
-        if length > 0:
-            # Normalize direction vector
-            dx /= length
-            dy /= length
-            
-            # Arrow position (slightly before the end point)
-            arrow_x = end_x - dx * 12
-            arrow_y = end_y - dy * 12
-            
-            # Arrow points
-            arrow_size = 10
-            perp_x = -dy * arrow_size
-            perp_y = dx * arrow_size
-            
-            self.arrow_id = self.canvas.create_polygon(
-                end_x, end_y,
-                arrow_x + perp_x/2, arrow_y + perp_y/2,
-                arrow_x - perp_x/2, arrow_y - perp_y/2,
-                fill=arrow_color, outline=arrow_color, tags="connection"
-            )
-        
-        # Draw connection label
+            # Straight line for single connections
+            points = [start_x, start_y, end_x, end_y]
+        
+        # Store curve points for better collision detection
+        self.curve_points = points
+        self._is_curved = curved
+        if not curved:
+            self._x1, self._y1, self._x2, self._y2 = points
+        if self.index is not None:
+            xs = points[0::2]
+            ys = points[1::2]
+            tol = CONNECTION_HIT_TOLERANCE
+            self.index.update(self, min(xs) - tol, min(ys) - tol, max(xs) + tol, max(ys) + tol)
+        
+        # Connection label
         label_x = (start_x + end_x) / 2
         label_y = (start_y + end_y) / 2
         
         # Offset label to avoid overlapping the line
-        if total_connections > 1 and connection_index > 0:
+        if curved:
             # For curved connections, place label near the curve
             label_offset = 20 + (connection_index * 8)
-            if abs(dx) > abs(dy):  # More horizontal
+            if abs(end_x - start_x) > abs(end_y - start_y):  # More horizontal
                 label_y += (label_offset if connection_index % 2 == 1 else -label_offset)
             else:  # More vertical
                 label_x += (label_offset if connection_index % 2 == 1 else -label_offset)
@@ -304,41 +581,35 @@ class FIFOConnection:
             else:  # More vertical
                 label_x += 15
         
-        text_color = "#FF5722" if self.selected else "#000"
-        self.text_id = self.canvas.create_text(
-            label_x, label_y, text=self.name, 
-            fill=text_color, font=("Arial", 9, "bold"), tags="connection"
-        )
+        return points, curved, label_x, label_y
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _sample_bezier(start_x, start_y, curve_x, curve_y, end_x, end_y):
+        """Sample a quadratic Bezier curve as a flat tuple of 21 (x, y) points"""
+        points = []
+        for b0, b1, b2 in _BEZIER_WEIGHTS:
+            points.append(b0 * start_x + b1 * curve_x + b2 * end_x)
+            points.append(b0 * start_y + b1 * curve_y + b2 * end_y)
+        return tuple(points)
     
-    def contains_point(self, x, y, tolerance=8):
+    def contains_point(self, x, y, tolerance=CONNECTION_HIT_TOLERANCE):
         """Check if point is near this connection line with improved precision"""
-        if not hasattr(self, 'curve_points') or not self.curve_points:
+        if not self.curve_points:
             return False
         
-        points = self.curve_points
-        min_distance = float('inf')
+        # Compare squared distances to avoid a sqrt per segment
+        tolerance_sq = tolerance * tolerance
         
         # For straight lines (2 points)
-        if len(points) == 4:
-            x1, y1, x2, y2 = points
-            distance = self._point_to_line_distance(x, y, x1, y1, x2, y2)
-            return distance <= tolerance
+        if not self._is_curved:
+            return self._point_to_line_distance_sq(x, y, self._x1, self._y1, self._x2, self._y2) <= tolerance_sq
         
         # For curved lines (multiple segments)
-        for i in range(0, len(points) - 2, 2):
-            x1, y1 = points[i], points[i + 1]
-            x2, y2 = points[i + 2], points[i + 3]
-            
-            distance = self._point_to_line_distance(x, y, x1, y1, x2, y2)
-            min_distance = min(min_distance, distance)
-            
-            if min_distance <= tolerance:
-                return True
-        
-        return False
+        return _polyline_near_point(self.curve_points, x, y, tolerance_sq)
     
-    def _point_to_line_distance(self, px, py, x1, y1, x2, y2):
-        """Calculate shortest distance from point to line segment"""
+    def _point_to_line_distance_sq(self, px, py, x1, y1, x2, y2):
+        """Calculate squared shortest distance from point to line segment"""
         # Vector from start to end of line
         A = px - x1
         B = py - y1
@@ -350,7 +621,7 @@ class FIFOConnection:
         
         if len_sq == 0:
             # Line is actually a point
-            return math.sqrt(A * A + B * B)
+            return A * A + B * B
         
         param = dot / len_sq
         
@@ -367,11 +638,177 @@ class FIFOConnection:
         
         dx = px - xx
         dy = py - yy
-        return math.sqrt(dx * dx + dy * dy)
+        return dx * dx + dy * dy
+    
+    def remove_from_pair(self):
+        """Remove this connection from its block pair's list and renumber the rest"""
+        pair = self._pair_list
+        if self in pair:
+            pair.remove(self)
+            for i, conn in enumerate(pair):
+                conn._pair_idx = i
+            if not pair:
+                # Drop the empty entry so neither block keeps the other one reachable
+                self.source_block.pair_connections.pop(self.target_block, None)
+                self.target_block.pair_connections.pop(self.source_block, None)
     
     def get_connection_info(self):
         """Get descriptive info about this connection for selection"""
         return f"{self.name} ({self.source_block.name} → {self.target_block.name}) [CH{self.src_ch_num}→CH{self.dst_ch_num}]"
+    
+    def to_fifo_info(self):
+        """Get this connection as an entry of a "fifo_infos" list"""
+        return {
+            "name": self.name,
+            "src": self.source_block.name,
+            "src_ch_num": self.src_ch_num,
+            "dst": self.target_block.name,
+            "dst_ch_num": self.dst_ch_num,
+            "qd": self.depth,
+            "width": self.width
+        }
+
+# Lines of help text inserted per idle callback while the help window fills
+_HELP_CHUNK_LINES = 50
+
+# Contents of the Help > Help Guide window
+_HELP_TEXT = """HARDWARE DESIGN TOOL - HELP GUIDE
+
+=== CREATING BLOCKS ===
+• Click "Add Block" or press Ctrl+N
+• Enter a name for your hardware module
+• Set block numbers manually via Properties (right-click → Properties)
+• Move blocks by clicking and dragging
+• Resize blocks by dragging the orange handle in bottom-right corner
+
+=== BLOCK NUMBERING ===
+• Block numbers are optional and user-defined
+• Edit block number via Properties dialog (right-click → Properties)
+• Leave number field empty for no number display
+• Numbers help organize large designs
+
+=== BLOCK SIZING OPTIONS ===
+• Manual resize: Drag the orange handle on selected blocks
+• Quick resize buttons: S (Small), M (Medium), L (Large), XL (Extra Large)
+• Select a block first, then click size buttons in toolbar
+
+=== CONNECTING BLOCKS (Multiple Ways) ===
+
+Method 1 - Drag to Connect (Easiest):
+• Click "Connect Mode" or press Ctrl+C
+• Click and drag from source block to target block
+• Visual feedback shows temporary connection line
+• Creates connection automatically when you release
+• Channel numbers assigned automatically (0, 1, 2, ...)
+
+Method 2 - Right-Click Quick Connect (Fastest):
+• Right-click on any block
+• Select "Quick Connect to →" and choose target
+• Or select "Connect from [BlockName]..." for step-by-step
+
+=== AUTOMATIC CHANNEL ASSIGNMENT ===
+• Source and destination channel numbers assigned automatically
+• Uses lowest available channel number for each block
+• Example: Block with channels 0,1,3 → next connection gets channel 2
+• Preserves manual assignments when loading saved files
+• "Reassign All Channels" button to reset all channel numbers
+
+=== FIFO CONNECTION DISPLAY ===
+• FIFO connections show only the FIFO name for clarity
+• View all properties in "Connection Info" dialog
+• Edit properties by double-clicking or right-clicking connections
+• Status bar shows channel assignments when connections created
+
+=== MULTIPLE CONNECTIONS ===
+• Up to 15 connections per block supported
+• Multiple FIFOs between same blocks automatically:
+  - Separated visually with curves
+  - Named uniquely (FIFO, FIFO_2, FIFO_3, etc.)
+  - Spread along block edges to avoid overlap
+  - Each gets unique channel numbers automatically
+
+=== INFORMATION TABS ===
+
+Block Info Tab:
+• View all blocks with numbers, names, positions, sizes
+• See connection counts for each block (X/15)
+• Renumber all blocks sequentially
+• Edit selected block properties directly
+
+Connection Info Tab (Interactive):
+• Columns: FIFO Name, Source, Src CH, Destination, Dst CH, Depth, Width
+• Grouped by block pairs for better organization
+• Double-click any connection to edit properties
+• "Edit Selected Connection" button for property editing
+• "Reassign All Channels" to reset channel numbering
+• Export/Import connections to/from JSON
+
+=== JSON CONNECTION EXPORT/IMPORT ===
+• Export connections: Save all FIFO connections to JSON file
+• Import connections: Load connections from JSON to existing blocks
+• Preserves all connection properties including channel numbers
+• Useful for sharing connection configurations
+• Access via Connection Info tab or File menu
+
+=== EDITING PROPERTIES ===
+• Double-click any block or connection
+• Right-click and select "Properties"
+• Select item and press F2
+• Connection properties: name, depth, width, channel numbers (manual override)
+• Block properties: name, width, height, number (optional)
+
+=== SELECTION AND DELETION ===
+• Left-click to select blocks or connections
+• Press Delete key to remove selected items
+• Right-click for context menus with quick actions
+
+=== DEBUG MODE ===
+• Click "Debug" button to toggle debug output on/off
+• Helpful for troubleshooting interaction issues
+• Shows detailed click, drag, and selection information
+
+=== KEYBOARD SHORTCUTS ===
+• Ctrl+N: Add new block
+• Ctrl+C: Toggle connect mode
+• Ctrl+S: Save design
+• Ctrl+O: Load design
+• Delete: Remove selected item
+• F2: Edit properties
+• Escape: Cancel operations
+
+=== FILE OPERATIONS ===
+• Save/Load Design: Full design with blocks, connections, and numbers
+• Export/Import Connections: Just connection data in JSON format
+• Export/Import FIFO Format: For external tools
+• All formats preserve block numbers and connection properties
+
+=== TIPS FOR BETTER PRODUCTIVITY ===
+• Use block numbers for large designs (edit via Properties)
+• Use larger blocks (L or XL) for complex designs
+• Export connections as JSON templates for reuse
+• Connect Mode + drag is fastest for multiple connections
+• Channel numbers assigned automatically - no manual setup needed
+• Use "Reassign All Channels" if channel numbering gets messy
+• Right-click is your friend for quick operations
+• Block Info and Connection Info tabs help manage complex designs
+• Double-click connections in Connection Info for quick editing
+• Use Debug mode if you encounter interaction issues"""
+
+# Contents of the Help > About window
+_ABOUT_TEXT = """Hardware Design Tool
+Block Diagram Editor
+
+Version 1.0
+
+Features:
+• Visual block diagram creation
+• Automatic FIFO connection management
+• Multiple connection types between blocks
+• JSON export/import functionality
+• Interactive property editing
+• Automatic channel assignment
+
+Created for hardware design workflows."""
 
 class HardwareDesignGUI:
     def __init__(self):
@@ -381,7 +818,7 @@ class HardwareDesignGUI:
         
         # Initialize variables
         self.blocks = []
-        self.connections = []
+        self.connections = {}  # FIFOConnection -> None; keeps creation order with O(1) removal
         self.selected_block = None
         self.selected_connection = None
         self.dragging = False
@@ -392,6 +829,33 @@ class HardwareDesignGUI:
         self.drag_start_y = 0
         self.debug_mode = False
         self.temp_line_id = None
+        self._pending_redraw = False
+        self._drag_target = None
+        self._motion_pos = None
+        self._motion_timer = None
+        self._last_motion_ts = 0.0
+        self._last_cursor = None
+        self._temp_line_end = None
+        
+        # Hit-testing: blocks are found through the canvas's own item lookup,
+        # connections through a grid over their padded bounding boxes
+        self._block_items = {}  # canvas item id -> Block
+        self._block_by_name = None  # name -> Block lookup, rebuilt on demand after blocks change
+        self._conn_grid = SpatialIndex()
+        
+        # Connections grouped by block pair for the info window; reset whenever
+        # connections are added or removed or a block is renamed
+        self._connection_groups = None
+        
+        # Right-click menus, built on first use and reconfigured for each click
+        self._block_menu = None
+        self._quick_connect_menu = None
+        self._connection_menu = None
+        self._canvas_menu = None
+        self._menu_connection = None  # Connection the connection menu was last shown for
+        
+        self._help_window = None  # Built on first use, then hidden and shown again
+        self._about_window = None  # Same for the about window
         
         self.create_widgets()
         self.bind_events()
@@ -467,6 +931,10 @@ class HardwareDesignGUI:
         
         ttk.Separator(toolbar, orient=tk.VERTICAL).pack(side=tk.LEFT, fill=tk.Y, padx=5)
         
+        # Connection label toggle button
+        self.labels_button = ttk.Button(toolbar, text="Hide Labels", command=self.toggle_labels)
+        self.labels_button.pack(side=tk.LEFT, padx=2)
+        
         # Debug toggle button
         self.debug_button = ttk.Button(toolbar, text="Debug", command=self.toggle_debug_mode)
         self.debug_button.pack(side=tk.LEFT, padx=2)
@@ -478,14 +946,14 @@ class HardwareDesignGUI:
         self.canvas = tk.Canvas(canvas_frame, bg="white", scrollregion=(0, 0, 2000, 2000))
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
-        # Scrollbars
-        v_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.VERTICAL, command=self.canvas.yview)
+        # Scrollbars, linked with Tcl command strings so scrolling never calls back into Python
+        v_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.VERTICAL, command=f"{self.canvas} yview")
         v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.canvas.configure(yscrollcommand=v_scrollbar.set)
+        self.canvas.configure(yscrollcommand=f"{v_scrollbar} set")
         
-        h_scrollbar = ttk.Scrollbar(self.root, orient=tk.HORIZONTAL, command=self.canvas.xview)
+        h_scrollbar = ttk.Scrollbar(self.root, orient=tk.HORIZONTAL, command=f"{self.canvas} xview")
         h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X, padx=5)
-        self.canvas.configure(xscrollcommand=h_scrollbar.set)
+        self.canvas.configure(xscrollcommand=f"{h_scrollbar} set")
         
         # Status bar
         status_frame = ttk.Frame(self.root)
@@ -518,6 +986,7 @@ class HardwareDesignGUI:
         self.root.bind("<Escape>", lambda e: self.cancel_operations())
     
     def add_block(self):
+        from tkinter import simpledialog
         name = simpledialog.askstring("Block Name", "Enter block name:", initialvalue="Module")
         if name:
             # Place new blocks at reasonable locations
@@ -531,8 +1000,9 @@ class HardwareDesignGUI:
                     y = max(block.y + block.height for block in self.blocks) + 50
             
             # No auto-numbering - let user set number manually
-            block = Block(self.canvas, x, y, name=name, number=None)
+            block = Block(self.canvas, x, y, name=name, number=None, index=self._block_items)
             self.blocks.append(block)
+            self._block_by_name = None
             self.status_var.set(f"Added block: {name} at ({x}, {y}) - Use Properties to set number")
     
     def toggle_connect_mode(self):
@@ -546,16 +1016,32 @@ class HardwareDesignGUI:
             self.status_var.set("Connect mode disabled")
     
     def quick_resize(self, width, height):
+        from tkinter import messagebox
         if self.selected_block:
             self.selected_block.resize(width, height)
             # Redraw connections that might be affected
-            for conn in self.connections:
-                if conn.source_block == self.selected_block or conn.target_block == self.selected_block:
-                    conn.draw()
+            for conn in self.selected_block.connections:
+                conn.draw()
             self.status_var.set(f"Resized {self.selected_block.name} to {width}x{height}")
         else:
             messagebox.showinfo("Info", "Please select a block first")
     
+    def _block_name_map(self):
+        """Return a name -> Block dict; with duplicate names the last block wins"""
+        if self._block_by_name is None:
+            self._block_by_name = {block.name: block for block in self.blocks}
+        return self._block_by_name
+    
+    def _blocks_at(self, x, y):
+        """Return the blocks whose canvas items lie under (x, y), top-most first"""
+        item_to_block = self._block_items
+        blocks = []
+        for item in reversed(self.canvas.find_overlapping(x, y, x, y)):
+            block = item_to_block.get(item)
+            if block is not None and block not in blocks:
+                blocks.append(block)
+        return blocks
+    
     def on_canvas_click(self, event):
         # Convert screen coordinates to canvas coordinates
         x = self.canvas.canvasx(event.x)
@@ -568,7 +1054,7 @@ class HardwareDesignGUI:
         self.clear_selections()
         
         # Check for block clicks (reverse order to prioritize top blocks)
-        for block in reversed(self.blocks):
+        for block in self._blocks_at(x, y):
             if block.contains_point(x, y):
                 if self.connecting:
                     # Connect mode logic
@@ -605,7 +1091,7 @@ class HardwareDesignGUI:
         
         # Check for connection clicks
         nearby_connections = []
-        for connection in self.connections:
+        for connection in self._conn_grid.query_point(x, y):
             if connection.contains_point(x, y):
                 nearby_connections.append(connection)
         
@@ -636,11 +1122,13 @@ class HardwareDesignGUI:
         y = self.canvas.canvasy(event.y)
         
         if self.connecting and self.connect_start_block:
-            # Draw temporary line while connecting
+            # Reshape the temporary line on the next idle cycle once it exists
             if self.temp_line_id:
-                self.canvas.delete(self.temp_line_id)
+                self._temp_line_end = (x, y)
+                self._schedule_redraw()
+                return
             
-            start_x, start_y = self.connect_start_block.get_connection_point(self.connect_start_block)  # Dummy for center
+            # Draw temporary line while connecting
             start_x = self.connect_start_block.x + self.connect_start_block.width / 2
             start_y = self.connect_start_block.y + self.connect_start_block.height / 2
             
@@ -657,14 +1145,14 @@ class HardwareDesignGUI:
             new_x = max(0, min(new_x, 1800))
             new_y = max(0, min(new_y, 1800))
             
-            self.selected_block.x = new_x
-            self.selected_block.y = new_y
-            self.selected_block.draw()
+            # Nothing to redraw if the clamped position is where the block already is
+            if new_x == self.selected_block.x and new_y == self.selected_block.y:
+                self._drag_target = None
+                return
             
-            # Redraw all connections for this block
-            for conn in self.connections:
-                if conn.source_block == self.selected_block or conn.target_block == self.selected_block:
-                    conn.draw()
+            # Defer the canvas update so bursts of motion events cost one redraw
+            self._drag_target = (self.selected_block, new_x, new_y)
+            self._schedule_redraw()
         
         elif self.resizing and self.selected_block:
             # Resize the block
@@ -673,17 +1161,49 @@ class HardwareDesignGUI:
             self.selected_block.resize(new_width, new_height)
             
             # Redraw connections
-            for conn in self.connections:
-                if conn.source_block == self.selected_block or conn.target_block == self.selected_block:
-                    conn.draw()
+            for conn in self.selected_block.connections:
+                conn.draw()
+    
+    def _schedule_redraw(self):
+        """Request a drag redraw on the next idle cycle (at most one pending)"""
+        if not self._pending_redraw:
+            self._pending_redraw = True
+            self.root.after_idle(self._flush_redraw)
+    
+    def _flush_redraw(self):
+        """Apply the latest drag position to the canvas"""
+        self._pending_redraw = False
+        if self._temp_line_end:
+            x, y = self._temp_line_end
+            self._temp_line_end = None
+            start = self.connect_start_block
+            if self.temp_line_id and start:
+                self.canvas.coords(self.temp_line_id, start.x + start.width / 2, start.y + start.height / 2, x, y)
+        
+        if not self._drag_target:
+            return
+        
+        block, new_x, new_y = self._drag_target
+        self._drag_target = None
+        
+        # Shift existing canvas items instead of recreating them
+        block.translate(new_x - block.x, new_y - block.y)
+        
+        # Move all connections for this block
+        for conn in block.connections:
+            conn.update_endpoints()
     
     def on_canvas_release(self, event):
         x = self.canvas.canvasx(event.x)
         y = self.canvas.canvasy(event.y)
         
+        # Commit any drag position still waiting for the idle redraw
+        if self._drag_target:
+            self._flush_redraw()
+        
         if self.connecting and self.connect_start_block and self.temp_line_id:
             # Check if released over a block
-            for block in self.blocks:
+            for block in self._blocks_at(x, y):
                 if block.contains_point(x, y) and block != self.connect_start_block:
                     self.create_connection_between_blocks(self.connect_start_block, block)
                     break
@@ -697,6 +1217,39 @@ class HardwareDesignGUI:
         self.dragging = False
         self.resizing = False
     
+    def _build_context_menus(self):
+        """Create the block, connection and canvas context menus"""
+        # Block menu; entries from index 4 on depend on the design and are re-added per click
+        self._block_menu = tk.Menu(self.root, tearoff=0)
+        self._block_menu.add_command(label="Block:", state="disabled")
+        self._block_menu.add_separator()
+        self._block_menu.add_command(label="Properties", command=self.edit_block_properties)
+        self._block_menu.add_separator()
+        self._quick_connect_menu = tk.Menu(self._block_menu, tearoff=0)
+        
+        # Connection menu; only the label is set per click, the commands act on _menu_connection
+        self._connection_menu = tk.Menu(self.root, tearoff=0)
+        self._connection_menu.add_command(label="FIFO:", state="disabled")
+        self._connection_menu.add_separator()
+        self._connection_menu.add_command(label="Properties", command=self._edit_menu_connection)
+        self._connection_menu.add_command(label="Delete Connection", command=self._delete_menu_connection)
+        
+        # Canvas menu never changes
+        self._canvas_menu = tk.Menu(self.root, tearoff=0)
+        self._canvas_menu.add_command(label="Add Block", command=self.add_block)
+        self._canvas_menu.add_separator()
+        self._canvas_menu.add_command(label="Block Info", command=self.show_block_info)
+        self._canvas_menu.add_command(label="Connection Info", command=self.show_connection_info)
+    
+    def _edit_menu_connection(self):
+        """Edit the connection the connection menu was shown for"""
+        self.edit_connection_properties_direct(self._menu_connection)
+    
+    def _delete_menu_connection(self):
+        """Delete the connection the connection menu was shown for"""
+        self.delete_connection(self._menu_connection)
+        self._menu_connection = None
+    
     def on_canvas_right_click(self, event):
         x = self.canvas.canvasx(event.x)
         y = self.canvas.canvasy(event.y)
@@ -705,19 +1258,20 @@ class HardwareDesignGUI:
         clicked_block = None
         clicked_connection = None
         
-        for block in reversed(self.blocks):
+        for block in self._blocks_at(x, y):
             if block.contains_point(x, y):
                 clicked_block = block
                 break
         
         if not clicked_block:
-            for connection in reversed(self.connections):
+            for connection in reversed(self._conn_grid.query_point(x, y)):
                 if connection.contains_point(x, y):
                     clicked_connection = connection
                     break
         
-        # Create context menu
-        context_menu = tk.Menu(self.root, tearoff=0)
+        # Reuse the context menus instead of creating new ones on every click
+        if self._block_menu is None:
+            self._build_context_menus()
         
         if clicked_block:
             # Block context menu
@@ -726,26 +1280,26 @@ class HardwareDesignGUI:
             clicked_block.selected = True
             clicked_block.draw()
             
-            context_menu.add_command(label=f"Block: {clicked_block.name}", state="disabled")
-            context_menu.add_separator()
-            context_menu.add_command(label="Properties", command=self.edit_block_properties)
-            context_menu.add_separator()
+            context_menu = self._block_menu
+            context_menu.entryconfigure(0, label=f"Block: {clicked_block.name}")
+            context_menu.delete(4, tk.END)
             
             # Quick connect submenu
             if len(self.blocks) > 1:
-                connect_menu = tk.Menu(context_menu, tearoff=0)
+                connect_menu = self._quick_connect_menu
+                connect_menu.delete(0, tk.END)
                 context_menu.add_cascade(label="Quick Connect to →", menu=connect_menu)
                 
                 for target_block in self.blocks:
                     if target_block != clicked_block:
                         connect_menu.add_command(
                             label=target_block.name,
-                            command=lambda t=target_block: self.create_connection_between_blocks(clicked_block, t)
+                            command=functools.partial(self.create_connection_between_blocks, clicked_block, target_block)
                         )
                 
                 context_menu.add_separator()
             
-            context_menu.add_command(label="Delete Block", command=lambda: self.delete_block(clicked_block))
+            context_menu.add_command(label="Delete Block", command=functools.partial(self.delete_block, clicked_block))
             
         elif clicked_connection:
             # Connection context menu
@@ -754,17 +1308,13 @@ class HardwareDesignGUI:
             clicked_connection.selected = True
             clicked_connection.draw()
             
-            context_menu.add_command(label=f"FIFO: {clicked_connection.name}", state="disabled")
-            context_menu.add_separator()
-            context_menu.add_command(label="Properties", command=lambda: self.edit_connection_properties_direct(clicked_connection))
-            context_menu.add_command(label="Delete Connection", command=lambda: self.delete_connection(clicked_connection))
+            context_menu = self._connection_menu
+            context_menu.entryconfigure(0, label=f"FIFO: {clicked_connection.name}")
+            self._menu_connection = clicked_connection
         
         else:
             # Canvas context menu
-            context_menu.add_command(label="Add Block", command=self.add_block)
-            context_menu.add_separator()
-            context_menu.add_command(label="Block Info", command=self.show_block_info)
-            context_menu.add_command(label="Connection Info", command=self.show_connection_info)
+            context_menu = self._canvas_menu
         
         # Show context menu
         try:
@@ -777,7 +1327,7 @@ class HardwareDesignGUI:
         y = self.canvas.canvasy(event.y)
         
         # Check for block double-click first
-        for block in reversed(self.blocks):
+        for block in self._blocks_at(x, y):
             if block.contains_point(x, y):
                 self.selected_block = block
                 self.edit_block_properties()
@@ -785,7 +1335,7 @@ class HardwareDesignGUI:
         
         # Check for connection double-click - find all connections near the click point
         nearby_connections = []
-        for connection in self.connections:
+        for connection in self._conn_grid.query_point(x, y):
             if connection.contains_point(x, y):
                 nearby_connections.append(connection)
         
@@ -800,6 +1350,7 @@ class HardwareDesignGUI:
     
     def show_connection_selection_dialog(self, connections, x, y):
         """Show a dialog to select which connection to edit when multiple overlap"""
+        from tkinter import messagebox
         # Create selection dialog
         dialog = tk.Toplevel(self.root)
         dialog.title("Select Connection to Edit")
@@ -882,24 +1433,58 @@ class HardwareDesignGUI:
         dialog.protocol("WM_DELETE_WINDOW", on_dialog_close)
     
     def on_canvas_motion(self, event):
-        x = self.canvas.canvasx(event.x)
-        y = self.canvas.canvasy(event.y)
+        # Motion with the button held is handled by on_canvas_drag
+        if self.dragging or self.resizing:
+            return
+        
+        # Connect mode always uses the crosshair - no hit-testing needed
+        if self.connecting:
+            self._set_cursor("crosshair")
+            return
+        
+        self._motion_pos = (self.canvas.canvasx(event.x), self.canvas.canvasy(event.y))
+        
+        # Limit hover hit-testing to ~60 updates per second; a trailing update
+        # applies the last position so the cursor is right when the mouse stops
+        if time.monotonic() - self._last_motion_ts < 0.016:
+            if not self._motion_timer:
+                self._motion_timer = self.root.after(16, self._update_hover_cursor)
+            return
+        
+        self._update_hover_cursor()
+    
+    def _update_hover_cursor(self):
+        """Set the canvas cursor for the last hover position"""
+        self._motion_timer = None
+        self._last_motion_ts = time.monotonic()
+        if not self._motion_pos or self.connecting:
+            return
+        x, y = self._motion_pos
         
         # Update cursor based on what's under the mouse
         cursor = "arrow"
+        for block in self._blocks_at(x, y):
+            if block.contains_point(x, y):
+                if block.is_resize_handle(x, y):
+                    cursor = "sizing"
+                else:
+                    cursor = "hand2"
+                break
         
-        if self.connecting:
-            cursor = "crosshair"
-        else:
-            for block in self.blocks:
-                if block.contains_point(x, y):
-                    if block.is_resize_handle(x, y):
-                        cursor = "sizing"
-                    else:
-                        cursor = "hand2"
-                    break
-        
-        self.canvas.configure(cursor=cursor)
+        self._set_cursor(cursor)
+    
+    def _set_cursor(self, cursor):
+        """Change the canvas cursor, skipping the Tk call when it is already set"""
+        if cursor != self._last_cursor:
+            self._last_cursor = cursor
+            self.canvas.configure(cursor=cursor)
+    
+    def _toast(self, message, duration=3000):
+        """Report a message in the status bar and in a banner that disappears on its own"""
+        self.status_var.set(message)
+        banner = tk.Label(self.root, text=message, bg="#333", fg="white", padx=10, pady=6, justify=tk.LEFT)
+        banner.place(relx=1.0, rely=1.0, x=-20, y=-40, anchor="se")
+        self.root.after(duration, banner.destroy)
     
     def on_key_press(self, event):
         if self.debug_mode:
@@ -917,7 +1502,7 @@ class HardwareDesignGUI:
             self.temp_line_id = None
         
         self.connect_button.configure(text="Connect Mode")
-        self.canvas.configure(cursor="arrow")
+        self._set_cursor("arrow")
     
     def clear_selections(self):
         self.clear_block_selection()
@@ -942,11 +1527,7 @@ class HardwareDesignGUI:
             target_block.can_add_connection()):
             
             # Count existing connections between these blocks
-            existing_connections = sum(1 for conn in self.connections 
-                                     if ((conn.source_block == source_block and 
-                                          conn.target_block == target_block) or
-                                         (conn.source_block == target_block and 
-                                          conn.target_block == source_block)))
+            existing_connections = len(source_block.pair_connections.get(target_block, ()))
             
             # Create unique FIFO name
             if existing_connections > 0:
@@ -955,16 +1536,13 @@ class HardwareDesignGUI:
                 fifo_name = "FIFO"
             
             # Create connection with automatic channel assignment
-            conn = FIFOConnection(self.canvas, source_block, target_block, name=fifo_name)
-            self.connections.append(conn)
+            conn = FIFOConnection(self.canvas, source_block, target_block, name=fifo_name, index=self._conn_grid)
+            self.connections[conn] = None
+            self._connection_groups = None
             
             # Redraw all connections between these blocks to update positioning
-            for connection in self.connections:
-                if ((connection.source_block == source_block and 
-                     connection.target_block == target_block) or
-                    (connection.source_block == target_block and 
-                     connection.target_block == source_block)):
-                    connection.draw()
+            for connection in conn._pair_list:
+                connection.draw()
             
             if existing_connections > 0:
                 self.status_var.set(f"Added {fifo_name} between {source_block.name} and {target_block.name} (CH{conn.src_ch_num}→CH{conn.dst_ch_num})")
@@ -979,8 +1557,27 @@ class HardwareDesignGUI:
                 self.status_var.set("Cannot connect: maximum 15 connections per block reached")
             return False
     
+    @contextlib.contextmanager
+    def batch_redraw(self):
+        """Defer connection draws made inside the block and draw each connection once at the end"""
+        if FIFOConnection.deferred_draws is not None:
+            # Already inside a batch - the outermost one does the drawing
+            yield
+            return
+        
+        pending = FIFOConnection.deferred_draws = {}
+        try:
+            yield
+        finally:
+            FIFOConnection.deferred_draws = None
+            for conn in pending:
+                # Skip connections deleted while the batch was open
+                if conn in self.connections:
+                    conn.draw()
+    
     def edit_properties(self):
         """Edit properties of the selected item"""
+        from tkinter import messagebox
         if self.selected_block:
             self.edit_block_properties()
         elif self.selected_connection:
@@ -988,8 +1585,9 @@ class HardwareDesignGUI:
         else:
             messagebox.showinfo("Info", "Please select a block or connection first")
     
-    def edit_block_properties(self):
+    def edit_block_properties(self, on_apply=None):
         """Edit properties of the selected block"""
+        from tkinter import messagebox
         if not self.selected_block:
             messagebox.showinfo("Info", "Please select a block first")
             return
@@ -1006,6 +1604,9 @@ class HardwareDesignGUI:
         # Center the dialog
         dialog.geometry("+%d+%d" % (self.root.winfo_rootx() + 50, self.root.winfo_rooty() + 50))
         
+        # Let Tk reject anything but digits in the numeric fields as it is typed
+        digits_vcmd = (dialog.register(lambda text: text == "" or text.isdigit()), "%P")
+        
         # Name field
         ttk.Label(dialog, text="Block Name:").grid(row=0, column=0, sticky="w", padx=10, pady=5)
         name_var = tk.StringVar(value=block.name)
@@ -1015,20 +1616,20 @@ class HardwareDesignGUI:
         # Number field
         ttk.Label(dialog, text="Block Number:").grid(row=1, column=0, sticky="w", padx=10, pady=5)
         number_var = tk.StringVar(value=str(block.number) if block.number is not None else "")
-        number_entry = ttk.Entry(dialog, textvariable=number_var, width=20)
+        number_entry = ttk.Entry(dialog, textvariable=number_var, width=20, validate="key", validatecommand=digits_vcmd)
         number_entry.grid(row=1, column=1, padx=10, pady=5)
         ttk.Label(dialog, text="(Leave empty for no number)", font=("Arial", 8)).grid(row=1, column=2, sticky="w", padx=5)
         
         # Width field
         ttk.Label(dialog, text="Width:").grid(row=2, column=0, sticky="w", padx=10, pady=5)
         width_var = tk.StringVar(value=str(int(block.width)))
-        width_entry = ttk.Entry(dialog, textvariable=width_var, width=20)
+        width_entry = ttk.Entry(dialog, textvariable=width_var, width=20, validate="key", validatecommand=digits_vcmd)
         width_entry.grid(row=2, column=1, padx=10, pady=5)
         
         # Height field
         ttk.Label(dialog, text="Height:").grid(row=3, column=0, sticky="w", padx=10, pady=5)
         height_var = tk.StringVar(value=str(int(block.height)))
-        height_entry = ttk.Entry(dialog, textvariable=height_var, width=20)
+        height_entry = ttk.Entry(dialog, textvariable=height_var, width=20, validate="key", validatecommand=digits_vcmd)
         height_entry.grid(row=3, column=1, padx=10, pady=5)
         
         def apply_changes():
@@ -1067,21 +1668,25 @@ class HardwareDesignGUI:
                     messagebox.showerror("Error", "Width and height must be positive")
                     return
                 
-                # Apply changes to the block object directly
-                block.name = new_name
-                block.number = new_number
-                block.resize(new_width, new_height)
-                
-                # Redraw block and its connections
-                block.draw()
-                for conn in self.connections:
-                    if conn.source_block == block or conn.target_block == block:
+                with self.batch_redraw():
+                    # Apply changes to the block object directly
+                    block.name = new_name
+                    block.number = new_number
+                    self._connection_groups = None
+                    self._block_by_name = None
+                    block.resize(new_width, new_height)
+                    
+                    # Redraw block and its connections
+                    block.draw()
+                    for conn in block.connections:
                         conn.draw()
                 
                 # Update status
                 number_text = f"#{new_number}" if new_number is not None else "no number"
                 self.status_var.set(f"Updated block: {new_name} ({number_text})")
                 
+                if on_apply:
+                    on_apply(block)
                 dialog.destroy()
                 
             except ValueError as e:
@@ -1102,6 +1707,7 @@ class HardwareDesignGUI:
     
     def delete_selected(self):
         """Delete the currently selected item"""
+        from tkinter import messagebox
         if self.selected_block:
             self.delete_block(self.selected_block)
         elif self.selected_connection:
@@ -1111,13 +1717,12 @@ class HardwareDesignGUI:
     
     def delete_block(self, block):
         """Delete a block and all its connections"""
+        from tkinter import messagebox
         if messagebox.askyesno("Confirm Delete", f"Delete block '{block.name}' and all its connections?"):
             # Remove all connections involving this block
-            connections_to_remove = [conn for conn in self.connections 
-                                   if conn.source_block == block or conn.target_block == block]
-            
-            for conn in connections_to_remove:
-                self.delete_connection(conn, confirm=False)
+            with self.batch_redraw():
+                for conn in list(block.connections):
+                    self.delete_connection(conn, confirm=False)
             
             # Remove block from canvas and list
             self.canvas.delete(block.id)
@@ -1126,6 +1731,9 @@ class HardwareDesignGUI:
                 self.canvas.delete(block.resize_handle_id)
             
             self.blocks.remove(block)
+            self._block_by_name = None
+            block.remove_from_index()
+            block.index = None
             
             if self.selected_block == block:
                 self.selected_block = None
@@ -1134,43 +1742,42 @@ class HardwareDesignGUI:
     
     def delete_connection(self, connection, confirm=True):
         """Delete a connection"""
+        from tkinter import messagebox
         if confirm and not messagebox.askyesno("Confirm Delete", f"Delete connection '{connection.name}'?"):
             return
         
         # Remove from canvas
         if connection.line_id:
             self.canvas.delete(connection.line_id)
-        if connection.arrow_id:
-            self.canvas.delete(connection.arrow_id)
         if connection.text_id:
             self.canvas.delete(connection.text_id)
         
         # Remove from block connections
-        if connection in connection.source_block.connections:
-            connection.source_block.connections.remove(connection)
-        if connection in connection.target_block.connections:
-            connection.target_block.connections.remove(connection)
+        connection.source_block.remove_connection(connection)
+        connection.target_block.remove_connection(connection)
+        connection.source_block.refresh_channel_masks()
+        connection.target_block.refresh_channel_masks()
+        connection.remove_from_pair()
         
         # Remove from main connections list
-        if connection in self.connections:
-            self.connections.remove(connection)
+        self.connections.pop(connection, None)
+        self._connection_groups = None
+        self._conn_grid.remove(connection)
+        connection.index = None
         
         if self.selected_connection == connection:
             self.selected_connection = None
         
-        # Redraw remaining connections between the same blocks to update positioning
-        for conn in self.connections:
-            if ((conn.source_block == connection.source_block and 
-                 conn.target_block == connection.target_block) or
-                (conn.source_block == connection.target_block and 
-                 conn.target_block == connection.source_block)):
-                conn.draw()
+        # Redraw remaining connections between the same blocks to update positioning
+        for conn in connection._pair_list:
+            conn.draw()
         
         if confirm:
             self.status_var.set(f"Deleted connection: {connection.name}")
     
     def show_block_info(self):
         """Show information about all blocks"""
+        from tkinter import messagebox
         if not self.blocks:
             messagebox.showinfo("Block Info", "No blocks in design")
             return
@@ -1209,19 +1816,22 @@ class HardwareDesignGUI:
         tree.pack(side="left", fill="both", expand=True, padx=10, pady=10)
         scrollbar.pack(side="right", fill="y", pady=10)
         
-        # Add data for each block
-        for i, block in enumerate(self.blocks):
-            connection_count = len(block.connections)
+        def block_row_values(block):
             display_number = str(block.number) if block.number is not None else "-"
-            tree.insert("", "end", values=(
+            return (
                 display_number,
                 block.name,
                 str(int(block.x)),
                 str(int(block.y)),
                 str(int(block.width)),
                 str(int(block.height)),
-                f"{connection_count}/15"
-            ))
+                f"{len(block.connections)}/15"
+            )
+        
+        # Add data for each block
+        block_rows = {}  # tree item id -> Block
+        for block in self.blocks:
+            block_rows[tree.insert("", "end", values=block_row_values(block))] = block
         
         # Button frame
         button_frame = ttk.Frame(info_window)
@@ -1243,15 +1853,17 @@ class HardwareDesignGUI:
             """Edit the selected block in the tree"""
             selection = tree.selection()
             if selection:
-                item = tree.item(selection[0])
-                block_name = item['values'][1]  # Name is in column 1
-                
-                # Find the block by name
-                for block in self.blocks:
-                    if block.name == block_name:
-                        self.selected_block = block
-                        self.edit_block_properties()
-                        return
+                item_id = selection[0]
+                block = block_rows.get(item_id)
+                if block in self.blocks:
+                    def update_row(block):
+                        # Refresh just this row if the window is still open
+                        if tree.winfo_exists():
+                            tree.item(item_id, values=block_row_values(block))
+                    
+                    self.selected_block = block
+                    self.edit_block_properties(on_apply=update_row)
+                    return
                         
                 messagebox.showerror("Error", "Block not found")
             else:
@@ -1263,8 +1875,18 @@ class HardwareDesignGUI:
         # Close button
         ttk.Button(info_window, text="Close", command=info_window.destroy).pack(pady=10)
     
+    def _grouped_connections(self):
+        """Return connections grouped by block pair label, with the labels in sorted order"""
+        if self._connection_groups is None:
+            connection_groups = defaultdict(list)
+            for conn in self.connections:
+                connection_groups[f"{conn.source_block.name} ↔ {conn.target_block.name}"].append(conn)
+            self._connection_groups = {key: connection_groups[key] for key in sorted(connection_groups)}
+        return self._connection_groups
+    
     def show_connection_info(self):
         """Show information about all connections"""
+        from tkinter import messagebox
         if not self.connections:
             messagebox.showinfo("Connection Info", "No connections in design")
             return
@@ -1281,12 +1903,7 @@ class HardwareDesignGUI:
         
         total_connections = len(self.connections)
         # Group connections by block pairs for statistics
-        connection_groups = {}
-        for conn in self.connections:
-            pair_key = f"{conn.source_block.name} ↔ {conn.target_block.name}"
-            if pair_key not in connection_groups:
-                connection_groups[pair_key] = []
-            connection_groups[pair_key].append(conn)
+        connection_groups = self._grouped_connections()
         
         total_pairs = len(connection_groups)
         ttk.Label(stats_frame, text=f"Total connections: {total_connections} | Block pairs: {total_pairs} | Channel numbers assigned automatically").pack()
@@ -1311,67 +1928,149 @@ class HardwareDesignGUI:
         tree.column("Depth", width=60)
         tree.column("Width", width=60)
         
-        # Add data grouped by block pairs
-        connection_list = []  # Keep track of connections for editing
-        for block_pair in sorted(connection_groups.keys()):
-            connections = connection_groups[block_pair]
-            
+        def connection_row_values(conn):
+            return (
+                conn.name,
+                conn.source_block.name,
+                str(conn.src_ch_num),
+                conn.target_block.name,
+                str(conn.dst_ch_num),
+                str(conn.depth),
+                str(conn.width)
+            )
+        
+        # Build the rows grouped by block pairs; (values, connection) with no
+        # connection for the pair headers and blank separators
+        rows = []
+        for block_pair, connections in connection_groups.items():
             # Add block pair header
-            tree.insert("", "end", values=(f"=== {block_pair} ===", "", "", "", "", "", ""))
+            rows.append(((f"=== {block_pair} ===", "", "", "", "", "", ""), None))
             
             # Add connections for this block pair
             for conn in connections:
-                item_id = tree.insert("", "end", values=(
-                    conn.name,
-                    conn.source_block.name,
-                    str(conn.src_ch_num),
-                    conn.target_block.name,
-                    str(conn.dst_ch_num),
-                    str(conn.depth),
-                    str(conn.width)
-                ))
-                connection_list.append((item_id, conn))  # Store mapping
+                rows.append((connection_row_values(conn), conn))
             
             # Add blank line for separation
-            tree.insert("", "end", values=("", "", "", "", "", "", ""))
+            rows.append((("", "", "", "", "", "", ""), None))
+        
+        # Only the rows that fit in the tree are inserted; scrolling refills them.
+        # Tree item ids are "r<row index>" so a selection maps straight back to rows
+        first_visible = 0
+        visible_rows = 20
+        selected_row = None
+        
+        def refill(start):
+            nonlocal first_visible
+            start = max(0, min(start, len(rows) - visible_rows))
+            end = min(len(rows), start + visible_rows)
+            first_visible = start
+            tree.delete(*tree.get_children())
+            for i in range(start, end):
+                tree.insert("", "end", iid=f"r{i}", values=rows[i][0])
+            if selected_row is not None and start <= selected_row < end:
+                tree.selection_set(f"r{selected_row}")
+            scrollbar.set(start / len(rows), end / len(rows))
+        
+        def on_scrollbar(action, amount, units=None):
+            if action == "moveto":
+                refill(int(float(amount) * len(rows)))
+            elif action == "scroll":
+                step = visible_rows if units == "pages" else 1
+                refill(first_visible + int(amount) * step)
+        
+        def on_mouse_wheel(event):
+            # Button-4/5 are the X11 wheel events; others report a signed delta
+            up = event.num == 4 or getattr(event, "delta", 0) > 0
+            refill(first_visible + (-3 if up else 3))
+            return "break"
+        
+        def on_tree_resize(event):
+            nonlocal visible_rows
+            children = tree.get_children()
+            bbox = tree.bbox(children[0]) if children else None
+            if bbox:
+                # bbox y is the heading height, bbox height the row height
+                fit = max(1, (event.height - bbox[1]) // bbox[3])
+                if fit != visible_rows:
+                    visible_rows = fit
+                    refill(first_visible)
+        
+        def on_tree_select(event):
+            nonlocal selected_row
+            selection = tree.selection()
+            if selection:
+                selected_row = int(selection[0][1:])
+        
+        def on_key_move(step, units, event):
+            # Move the selection by rows or pages, refilling so it stays in view
+            nonlocal selected_row
+            if units == "pages":
+                step *= visible_rows
+            row = 0 if selected_row is None else max(0, min(len(rows) - 1, selected_row + step))
+            selected_row = row
+            if row < first_visible:
+                refill(row)
+            elif row >= first_visible + visible_rows:
+                refill(row - visible_rows + 1)
+            else:
+                tree.selection_set(f"r{row}")
+            tree.focus(f"r{row}")
+            return "break"
+        
+        # Editor dialog opened from this window, so repeated clicks on its row reuse it
+        editor_conn = None
+        editor_dialog = None
+        
+        def edit_row(row):
+            """Open the editor for a tree row; only that row is refreshed when it is applied"""
+            nonlocal editor_conn, editor_dialog
+            item_id = f"r{row}"
+            conn = rows[row][1]
+            if conn is None:
+                return False
+            
+            # Bring the open editor forward instead of stacking a second one
+            if editor_conn is conn and editor_dialog.winfo_exists():
+                editor_dialog.lift()
+                return True
+            
+            def update_row(conn):
+                # Refresh just this row if the window is still open
+                rows[row] = (connection_row_values(conn), conn)
+                if tree.winfo_exists() and tree.exists(item_id):
+                    tree.item(item_id, values=rows[row][0])
+            
+            editor_dialog = self.edit_connection_properties_direct(conn, on_apply=update_row)
+            editor_conn = conn
+            return True
         
         def on_double_click(event):
             """Handle double-click to edit connection"""
-            selection = tree.selection()
-            if selection:
-                item_id = selection[0]
-                # Find the connection for this item
-                for stored_id, conn in connection_list:
-                    if stored_id == item_id:
-                        self.edit_connection_properties_direct(conn)
-                        # Refresh the display
-                        info_window.destroy()
-                        self.show_connection_info()
-                        break
+            # The selected row may have been scrolled out of the inserted window
+            if selected_row is not None:
+                edit_row(selected_row)
         
         def edit_selected_connection():
             """Edit the selected connection in the tree"""
-            selection = tree.selection()
-            if selection:
-                item_id = selection[0]
-                # Find the connection for this item
-                for stored_id, conn in connection_list:
-                    if stored_id == item_id:
-                        self.edit_connection_properties_direct(conn)
-                        # Refresh the display
-                        info_window.destroy()
-                        self.show_connection_info()
-                        return
+            if selected_row is not None:
+                if edit_row(selected_row):
+                    return
                 messagebox.showinfo("Info", "Selected item is not a connection")
             else:
                 messagebox.showinfo("Info", "Please select a connection from the list first")
         
         # Bind double-click event
         tree.bind("<Double-1>", on_double_click)
+        tree.bind("<<TreeviewSelect>>", on_tree_select)
+        tree.bind("<Configure>", on_tree_resize)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            tree.bind(sequence, on_mouse_wheel)
+        for sequence, step, units in (("<Up>", -1, "units"), ("<Down>", 1, "units"), ("<Prior>", -1, "pages"), ("<Next>", 1, "pages")):
+            tree.bind(sequence, functools.partial(on_key_move, step, units))
         
-        # Add scrollbar
-        scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=tree.yview)
-        tree.configure(yscrollcommand=scrollbar.set)
+        # Add scrollbar driving the row window rather than the tree itself
+        scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=on_scrollbar)
+        refill(0)
         
         tree.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
@@ -1394,29 +2093,53 @@ class HardwareDesignGUI:
                 "Continue?")
             
             if result:
-                # Clear all connections temporarily to reset channel assignments
+                # Channels restart at 0 on every block, so each block's next free
+                # channel is simply how many it has handed out so far
+                src_counter = defaultdict(int)
+                dst_counter = defaultdict(int)
+                planned = []
                 for conn in self.connections:
-                    # Remove from block connection lists
-                    if conn in conn.source_block.connections:
-                        conn.source_block.connections.remove(conn)
-                    if conn in conn.target_block.connections:
-                        conn.target_block.connections.remove(conn)
+                    source_block = conn.source_block
+                    target_block = conn.target_block
+                    planned.append((conn, src_counter[source_block], dst_counter[target_block]))
+                    src_counter[source_block] += 1
+                    dst_counter[target_block] += 1
                 
-                # Reassign channel numbers and add back to blocks
-                for conn in self.connections:
-                    conn.src_ch_num = conn.source_block.get_next_available_src_channel()
-                    conn.dst_ch_num = conn.target_block.get_next_available_dst_channel()
-                    
-                    # Add back to block connection lists
-                    conn.source_block.connections.append(conn)
-                    conn.target_block.connections.append(conn)
+                # Leave the design untouched when the numbering is already sequential
+                if all(conn.src_ch_num == src_ch and conn.dst_ch_num == dst_ch for conn, src_ch, dst_ch in planned):
+                    self.status_var.set("Channel numbers are already assigned in order; nothing to change")
+                    return
+                
+                # Clear all block connection lists to reset channel assignments
+                for block in self.blocks:
+                    block.connections.clear()
+                
+                with self.batch_redraw():
+                    for conn, src_ch, dst_ch in planned:
+                        source_block = conn.source_block
+                        target_block = conn.target_block
+                        conn.src_ch_num = src_ch
+                        conn.dst_ch_num = dst_ch
+                        
+                        # Add back to block connection lists
+                        source_block.add_connection(conn)
+                        target_block.add_connection(conn)
+                        
+                        # Redraw connection once everything is renumbered
+                        conn.draw()
                     
-                    # Redraw connection
-                    conn.draw()
+                    for block in self.blocks:
+                        block.refresh_channel_masks()
                 
-                # Refresh the display
-                info_window.destroy()
-                self.show_connection_info()
+                # Refresh the rows whose channels changed; grouping and order are unaffected
+                for row, (values, conn) in enumerate(rows):
+                    if conn is None:
+                        continue
+                    new_values = connection_row_values(conn)
+                    if new_values != values:
+                        rows[row] = (new_values, conn)
+                        if tree.exists(f"r{row}"):
+                            tree.item(f"r{row}", values=new_values)
                 self.status_var.set(f"Reassigned channel numbers for {len(self.connections)} connections")
         
         ttk.Button(button_frame, text="Reassign All Channels", command=reassign_all_channels).pack(side=tk.LEFT, padx=5)
@@ -1426,8 +2149,9 @@ class HardwareDesignGUI:
         # Close button
         ttk.Button(info_window, text="Close", command=info_window.destroy).pack(pady=10)
     
-    def edit_connection_properties_direct(self, connection):
-        """Edit properties of a specific connection"""
+    def edit_connection_properties_direct(self, connection, on_apply=None):
+        """Edit properties of a specific connection and return the dialog window"""
+        from tkinter import messagebox
         # Create properties dialog
         dialog = tk.Toplevel(self.root)
         dialog.title(f"Edit Connection Properties - {connection.name}")
@@ -1445,43 +2169,37 @@ class HardwareDesignGUI:
         ttk.Label(dialog, text="Connection Information", font=("Arial", 12, "bold")).grid(row=0, column=0, columnspan=2, pady=(10, 5))
         ttk.Label(dialog, text=f"From: {connection.source_block.name} → To: {connection.target_block.name}").grid(row=1, column=0, columnspan=2, pady=(0, 15))
         
-        # FIFO name field
-        ttk.Label(dialog, text="FIFO Name:").grid(row=2, column=0, sticky="w", padx=10, pady=5)
-        name_var = tk.StringVar(value=connection.name)
-        name_entry = ttk.Entry(dialog, textvariable=name_var, width=25)
-        name_entry.grid(row=2, column=1, padx=10, pady=5, sticky="ew")
+        # Editable fields as (label, attribute, cast); entries are laid out from row 2 down
+        fields = (
+            ("FIFO Name:", "name", str),
+            ("Queue Depth:", "depth", int),
+            ("Data Width:", "width", int),
+            ("Source Channel:", "src_ch_num", int),
+            ("Destination Channel:", "dst_ch_num", int),
+        )
         
-        # Depth field
-        ttk.Label(dialog, text="Queue Depth:").grid(row=3, column=0, sticky="w", padx=10, pady=5)
-        depth_var = tk.StringVar(value=str(connection.depth))
-        depth_entry = ttk.Entry(dialog, textvariable=depth_var, width=25)
-        depth_entry.grid(row=3, column=1, padx=10, pady=5, sticky="ew")
+        # Let Tk reject non-numeric keystrokes in the integer fields
+        int_vcmd = (dialog.register(lambda text: text in ("", "-") or text.lstrip("-").isdigit()), "%P")
         
-        # Width field
-        ttk.Label(dialog, text="Data Width:").grid(row=4, column=0, sticky="w", padx=10, pady=5)
-        width_var = tk.StringVar(value=str(connection.width))
-        width_entry = ttk.Entry(dialog, textvariable=width_var, width=25)
-        width_entry.grid(row=4, column=1, padx=10, pady=5, sticky="ew")
-        
-        # Source channel field
-        ttk.Label(dialog, text="Source Channel:").grid(row=5, column=0, sticky="w", padx=10, pady=5)
-        src_ch_var = tk.StringVar(value=str(connection.src_ch_num))
-        src_ch_entry = ttk.Entry(dialog, textvariable=src_ch_var, width=25)
-        src_ch_entry.grid(row=5, column=1, padx=10, pady=5, sticky="ew")
-        
-        # Destination channel field
-        ttk.Label(dialog, text="Destination Channel:").grid(row=6, column=0, sticky="w", padx=10, pady=5)
-        dst_ch_var = tk.StringVar(value=str(connection.dst_ch_num))
-        dst_ch_entry = ttk.Entry(dialog, textvariable=dst_ch_var, width=25)
-        dst_ch_entry.grid(row=6, column=1, padx=10, pady=5, sticky="ew")
+        field_vars = []
+        entries = []
+        for row, (label, attr, cast) in enumerate(fields, start=2):
+            ttk.Label(dialog, text=label).grid(row=row, column=0, sticky="w", padx=10, pady=5)
+            var = tk.StringVar(value=str(getattr(connection, attr)))
+            if cast is int:
+                entry = ttk.Entry(dialog, textvariable=var, width=25, validate="key", validatecommand=int_vcmd)
+            else:
+                entry = ttk.Entry(dialog, textvariable=var, width=25)
+            entry.grid(row=row, column=1, padx=10, pady=5, sticky="ew")
+            field_vars.append(var)
+            entries.append(entry)
+        name_entry = entries[0]
         
         def apply_changes():
             try:
-                new_name = name_var.get().strip()
-                new_depth = int(depth_var.get())
-                new_width = int(width_var.get())
-                new_src_ch = int(src_ch_var.get())
-                new_dst_ch = int(dst_ch_var.get())
+                values = [cast(var.get()) for var, (_, _, cast) in zip(field_vars, fields)]
+                values[0] = values[0].strip()
+                new_name, new_depth, new_width, new_src_ch, new_dst_ch = values
                 
                 if not new_name:
                     messagebox.showerror("Error", "FIFO name cannot be empty")
@@ -1496,16 +2214,17 @@ class HardwareDesignGUI:
                     return
                 
                 # Apply changes
-                connection.name = new_name
-                connection.depth = new_depth
-                connection.width = new_width
-                connection.src_ch_num = new_src_ch
-                connection.dst_ch_num = new_dst_ch
+                for (_, attr, _), value in zip(fields, values):
+                    setattr(connection, attr, value)
+                connection.source_block.refresh_channel_masks()
+                connection.target_block.refresh_channel_masks()
                 
                 # Redraw connection
                 connection.draw()
                 
                 self.status_var.set(f"Updated connection: {new_name}")
+                if on_apply:
+                    on_apply(connection)
                 dialog.destroy()
                 
             except ValueError as e:
@@ -1521,9 +2240,11 @@ class HardwareDesignGUI:
         # Focus on name entry
         name_entry.focus()
         name_entry.select_range(0, tk.END)
+        return dialog
     
     def export_connections_json(self):
         """Export all connections to a JSON file with compact horizontal formatting"""
+        from tkinter import filedialog, messagebox
         if not self.connections:
             messagebox.showinfo("Info", "No connections to export")
             return
@@ -1536,73 +2257,60 @@ class HardwareDesignGUI:
         
         if filename:
             try:
-                # Create fifo_infos array with compact format
-                fifo_infos = []
-                for conn in self.connections:
-                    conn_data = {
-                        "name": conn.name,
-                        "src": conn.source_block.name,
-                        "src_ch_num": conn.src_ch_num,
-                        "dst": conn.target_block.name,
-                        "dst_ch_num": conn.dst_ch_num,
-                        "qd": conn.depth,
-                        "width": conn.width
-                    }
-                    fifo_infos.append(conn_data)
+                connection_count = len(self.connections)
                 
+                # fifo_infos entries are produced lazily while the file is written
                 connections_data = {
                     "metadata": {
                         "exported_from": "Hardware Design Tool",
                         "export_date": datetime.now().isoformat(),
-                        "total_connections": len(self.connections)
+                        "total_connections": connection_count
                     },
-                    "fifo_infos": fifo_infos
+                    "fifo_infos": self._fifo_infos()
                 }
                 
                 # Write with custom formatting
                 with open(filename, 'w') as f:
                     self.write_compact_json(f, connections_data)
                 
-                self.status_var.set(f"Exported {len(self.connections)} connections to {filename}")
-                messagebox.showinfo("Success", f"Exported {len(self.connections)} connections to:\n{filename}")
+                self.status_var.set(f"Exported {connection_count} connections to {filename}")
+                messagebox.showinfo("Success", f"Exported {connection_count} connections to:\n{filename}")
                 
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to export connections:\n{str(e)}")
     
+    def _fifo_infos(self):
+        """Iterate over every connection as a "fifo_infos" entry, in creation order"""
+        return map(FIFOConnection.to_fifo_info, self.connections)
+    
     def write_compact_json(self, file, data):
         """Write JSON with compact horizontal formatting for fifo_infos"""
-        file.write("{\n")
+        # Build the whole document in memory and write it once
+        parts = ["{\n"]
         
         # Write metadata section normally
         if "metadata" in data:
-            file.write('  "metadata": ')
-            json.dump(data["metadata"], file, indent=2)
-            file.write(",\n")
+            parts.append('  "metadata": ')
+            parts.append(json.dumps(data["metadata"], indent=2))
+            parts.append(",\n")
         
         # Write fifo_infos with compact formatting
         if "fifo_infos" in data:
-            file.write('  "fifo_infos": [\n')
-            fifo_infos = data["fifo_infos"]
-            for i, fifo in enumerate(fifo_infos):
-                file.write("    ")
-                # Write each connection as a single line
-                json.dump(fifo, file, separators=(',', ': '))
-                if i < len(fifo_infos) - 1:
-                    file.write(",")
-                file.write("\n")
-            file.write("  ]\n")
+            parts.append(_compact_fifo_infos(data["fifo_infos"]))
         
         # Write other sections normally
         for key, value in data.items():
             if key not in ["metadata", "fifo_infos"]:
-                file.write(f'  "{key}": ')
-                json.dump(value, file, indent=2)
-                file.write("\n")
+                parts.append(f'  "{key}": ')
+                parts.append(json.dumps(value, indent=2))
+                parts.append("\n")
         
-        file.write("}")
+        parts.append("}")
+        file.write("".join(parts))
     
     def import_connections_json(self):
         """Import connections from a JSON file"""
+        from tkinter import filedialog, messagebox
         filename = filedialog.askopenfilename(
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
             title="Import Connections from JSON"
@@ -1610,8 +2318,7 @@ class HardwareDesignGUI:
         
         if filename:
             try:
-                with open(filename, 'r') as f:
-                    data = json.load(f)
+                data = _read_json_file(filename)
                 
                 # Support both new "fifo_infos" format and old "connections" format
                 if "fifo_infos" in data:
@@ -1624,82 +2331,100 @@ class HardwareDesignGUI:
                     messagebox.showerror("Error", "Invalid JSON format: neither 'fifo_infos' nor 'connections' key found")
                     return
                 
-                # Create a map of existing blocks
-                block_map = {block.name: block for block in self.blocks}
+                # Look up existing blocks by name
+                block_map = self._block_name_map()
                 
-                imported_count = 0
-                skipped_count = 0
-                error_messages = []
+                # Errors are kept as (row, message) so they are reported in file order
+                errors = []
+                
+                # Handle both formats: pick the field names once instead of per row
+                if format_type == "fifo_infos":
+                    get_endpoints = operator.itemgetter("src", "dst")
+                    name_key, depth_key, width_key, src_ch_key, dst_ch_key = "name", "qd", "width", "src_ch_num", "dst_ch_num"
+                else:  # connections format
+                    get_endpoints = operator.itemgetter("source_block", "destination_block")
+                    name_key, depth_key, width_key, src_ch_key, dst_ch_key = (
+                        "fifo_name", "queue_depth", "data_width", "source_channel", "destination_channel")
                 
-                for conn_data in connections_data:
+                # First pass: read every row and resolve its blocks without touching the design
+                records = []
+                for row, conn_data in enumerate(connections_data):
                     try:
-                        # Handle both formats
-                        if format_type == "fifo_infos":
-                            source_name = conn_data["src"]
-                            dest_name = conn_data["dst"]
-                            fifo_name = conn_data.get("name", "FIFO")
-                            queue_depth = conn_data.get("qd", 16)
-                            data_width = conn_data.get("width", 32)
-                            source_channel = conn_data.get("src_ch_num", 0)
-                            dest_channel = conn_data.get("dst_ch_num", 0)
-                        else:  # connections format
-                            source_name = conn_data["source_block"]
-                            dest_name = conn_data["destination_block"]
-                            fifo_name = conn_data.get("fifo_name", "FIFO")
-                            queue_depth = conn_data.get("queue_depth", 16)
-                            data_width = conn_data.get("data_width", 32)
-                            source_channel = conn_data.get("source_channel", 0)
-                            dest_channel = conn_data.get("destination_channel", 0)
+                        source_name, dest_name = get_endpoints(conn_data)
+                        get = conn_data.get
+                        fifo_name = get(name_key, "FIFO")
+                        queue_depth = get(depth_key, 16)
+                        data_width = get(width_key, 32)
+                        source_channel = get(src_ch_key, 0)
+                        dest_channel = get(dst_ch_key, 0)
                         
                         if source_name not in block_map:
-                            error_messages.append(f"Source block '{source_name}' not found")
-                            skipped_count += 1
+                            errors.append((row, f"Source block '{source_name}' not found"))
                             continue
                         
                         if dest_name not in block_map:
-                            error_messages.append(f"Destination block '{dest_name}' not found")
-                            skipped_count += 1
-                            continue
-                        
-                        source_block = block_map[source_name]
-                        dest_block = block_map[dest_name]
-                        
-                        # Check if blocks can accept more connections
-                        if not source_block.can_add_connection():
-                            error_messages.append(f"Source block '{source_name}' has reached connection limit")
-                            skipped_count += 1
-                            continue
-                        
-                        if not dest_block.can_add_connection():
-                            error_messages.append(f"Destination block '{dest_name}' has reached connection limit")
-                            skipped_count += 1
+                            errors.append((row, f"Destination block '{dest_name}' not found"))
                             continue
                         
-                        # Create the connection with preserved channel numbers
-                        conn = FIFOConnection(
-                            self.canvas,
-                            source_block,
-                            dest_block,
-                            fifo_name,
-                            queue_depth,
-                            data_width,
-                            source_channel,  # Preserve imported channel numbers
-                            dest_channel     # Preserve imported channel numbers
-                        )
-                        self.connections.append(conn)
-                        imported_count += 1
+                        records.append((row, block_map[source_name], block_map[dest_name], fifo_name,
+                                        queue_depth, data_width, source_channel, dest_channel))
                         
                     except Exception as e:
-                        error_messages.append(f"Error importing connection: {str(e)}")
-                        skipped_count += 1
+                        errors.append((row, f"Error importing connection: {str(e)}"))
+                
+                # Second pass: create the valid connections; drawing waits until the batch ends
+                imported_count = 0
+                # Free connection slots per block, counted down as connections are created
+                connections_left = {block: block.max_connections - len(block.connections) for block in self.blocks}
+                with self.batch_redraw():
+                    for (row, source_block, dest_block, fifo_name, queue_depth, data_width,
+                         source_channel, dest_channel) in records:
+                        try:
+                            # Check if blocks can accept more connections
+                            if connections_left[source_block] <= 0:
+                                errors.append((row, f"Source block '{source_block.name}' has reached connection limit"))
+                                continue
+                            
+                            if connections_left[dest_block] <= 0:
+                                errors.append((row, f"Destination block '{dest_block.name}' has reached connection limit"))
+                                continue
+                            
+                            # The constructor links both blocks before anything in it can fail
+                            connections_left[source_block] -= 1
+                            connections_left[dest_block] -= 1
+                            
+                            # Create the connection with preserved channel numbers
+                            conn = FIFOConnection(
+                                self.canvas,
+                                source_block,
+                                dest_block,
+                                fifo_name,
+                                queue_depth,
+                                data_width,
+                                source_channel,  # Preserve imported channel numbers
+                                dest_channel,    # Preserve imported channel numbers
+                                index=self._conn_grid
+                            )
+                            self.connections[conn] = None
+                            self._connection_groups = None
+                            imported_count += 1
+                            
+                        except Exception as e:
+                            errors.append((row, f"Error importing connection: {str(e)}"))
                 
+                errors.sort(key=lambda error: error[0])
+                error_messages = [message for _, message in errors]
+                skipped_count = len(errors)
+                    
                 # Show results
-                result_msg = f"Import completed!\nImported: {imported_count} connections\nSkipped: {skipped_count} connections"
+                result_lines = [f"Import completed!\nImported: {imported_count} connections\nSkipped: {skipped_count} connections"]
                 
                 if error_messages:
-                    result_msg += f"\n\nErrors encountered:\n" + "\n".join(error_messages[:10])
+                    result_lines.append("\nErrors encountered:")
+                    result_lines.extend(error_messages[:10])
                     if len(error_messages) > 10:
-                        result_msg += f"\n... and {len(error_messages) - 10} more errors"
+                        result_lines.append(f"... and {len(error_messages) - 10} more errors")
+                result_msg = "\n".join(result_lines)
                 
                 if imported_count > 0:
                     messagebox.showinfo("Import Results", result_msg)
@@ -1712,6 +2437,7 @@ class HardwareDesignGUI:
     
     def new_design(self):
         """Create a new design (clear all blocks and connections)"""
+        from tkinter import messagebox
         if self.blocks or self.connections:
             if not messagebox.askyesno("New Design", "This will clear the current design. Continue?"):
                 return
@@ -1721,7 +2447,11 @@ class HardwareDesignGUI:
         
         # Clear data structures
         self.blocks = []
-        self.connections = []
+        self.connections = {}
+        self._connection_groups = None
+        self._block_items.clear()
+        self._block_by_name = None
+        self._conn_grid.clear()
         self.selected_block = None
         self.selected_connection = None
         
@@ -1732,6 +2462,7 @@ class HardwareDesignGUI:
     
     def save_json(self):
         """Save design to JSON file with compact connection formatting"""
+        from tkinter import filedialog, messagebox
         filename = filedialog.asksaveasfilename(
             defaultextension=".json",
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
@@ -1747,7 +2478,8 @@ class HardwareDesignGUI:
                         "version": "1.0"
                     },
                     "blocks": [],
-                    "fifo_infos": []
+                    # Generated while writing rather than built up front
+                    "fifo_infos": self._fifo_infos()
                 }
                 
                 # Save blocks
@@ -1762,19 +2494,6 @@ class HardwareDesignGUI:
                     }
                     design_data["blocks"].append(block_data)
                 
-                # Save connections in compact format
-                for conn in self.connections:
-                    conn_data = {
-                        "name": conn.name,
-                        "src": conn.source_block.name,
-                        "src_ch_num": conn.src_ch_num,
-                        "dst": conn.target_block.name,
-                        "dst_ch_num": conn.dst_ch_num,
-                        "qd": conn.depth,
-                        "width": conn.width
-                    }
-                    design_data["fifo_infos"].append(conn_data)
-                
                 # Write with custom formatting
                 with open(filename, 'w') as f:
                     self.write_compact_design_json(f, design_data)
@@ -1787,45 +2506,38 @@ class HardwareDesignGUI:
     
     def write_compact_design_json(self, file, data):
         """Write full design JSON with compact horizontal formatting for fifo_infos"""
-        file.write("{\n")
+        # Build the whole document in memory and write it once
+        parts = ["{\n"]
         
         # Write metadata section
         if "metadata" in data:
-            file.write('  "metadata": ')
-            json.dump(data["metadata"], file, indent=2)
-            file.write(",\n")
+            parts.append('  "metadata": ')
+            parts.append(json.dumps(data["metadata"], indent=2))
+            parts.append(",\n")
         
         # Write blocks section
         if "blocks" in data:
-            file.write('  "blocks": ')
-            json.dump(data["blocks"], file, indent=2)
-            file.write(",\n")
+            parts.append('  "blocks": ')
+            parts.append(json.dumps(data["blocks"], indent=2))
+            parts.append(",\n")
         
         # Write fifo_infos with compact formatting
         if "fifo_infos" in data:
-            file.write('  "fifo_infos": [\n')
-            fifo_infos = data["fifo_infos"]
-            for i, fifo in enumerate(fifo_infos):
-                file.write("    ")
-                # Write each connection as a single line
-                json.dump(fifo, file, separators=(',', ': '))
-                if i < len(fifo_infos) - 1:
-                    file.write(",")
-                file.write("\n")
-            file.write("  ]\n")
-        
-        file.write("}")
+            parts.append(_compact_fifo_infos(data["fifo_infos"]))
+        
+        parts.append("}")
+        file.write("".join(parts))
     
     def load_json(self):
         """Load design from JSON file (supports both old and new formats)"""
+        from tkinter import filedialog, messagebox
         filename = filedialog.askopenfilename(
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
         )
         
         if filename:
             try:
-                with open(filename, 'r') as f:
-                    design_data = json.load(f)
+                design_data = _read_json_file(filename)
                 
                 # Clear current design
                 self.new_design()
@@ -1834,8 +2546,10 @@ class HardwareDesignGUI:
                     messagebox.showerror("Error", "Invalid JSON format")
                     return
                 
-                # Load blocks
+                # Load blocks into a local lookup; the shared one is rebuilt on demand, since
+                # new_design() leaves the old blocks in place if the user declined to clear them
                 block_map = {}
+                self._block_by_name = None
                 for block_data in design_data.get("blocks", []):
                     block = Block(
                         self.canvas,
@@ -1844,52 +2558,58 @@ class HardwareDesignGUI:
                         block_data["width"],
                         block_data["height"],
                         block_data["name"],
-                        block_data.get("number")  # Load number if available
+                        block_data.get("number"),  # Load number if available
+                        index=self._block_items
                     )
                     self.blocks.append(block)
                     block_map[block.name] = block
                 
-                # Load connections - handle both old and new formats
-                if "fifo_infos" in design_data:
-                    # New format with fifo_infos
-                    for conn_data in design_data["fifo_infos"]:
-                        source_name = conn_data["src"]
-                        target_name = conn_data["dst"]
-                        if source_name in block_map and target_name in block_map:
-                            source_block = block_map[source_name]
-                            target_block = block_map[target_name]
-                            conn = FIFOConnection(
-                                self.canvas,
-                                source_block,
-                                target_block,
-                                conn_data["name"],
-                                conn_data["qd"],
-                                conn_data["width"],
-                                conn_data.get("src_ch_num", 0),  # Preserve saved channel numbers
-                                conn_data.get("dst_ch_num", 0)   # Preserve saved channel numbers
-                            )
-                            self.connections.append(conn)
-                
-                else:
-                    # Old format with connections nested in blocks
-                    for block_data in design_data.get("blocks", []):
-                        source_block = block_map[block_data["name"]]
-                        for conn_data in block_data.get("connections", []):
-                            target_name = conn_data["target"]
-                            if target_name in block_map:
+                with self.batch_redraw():
+                    # Load connections - handle both old and new formats
+                    if "fifo_infos" in design_data:
+                        # New format with fifo_infos
+                        for conn_data in design_data["fifo_infos"]:
+                            source_name = conn_data["src"]
+                            target_name = conn_data["dst"]
+                            if source_name in block_map and target_name in block_map:
+                                source_block = block_map[source_name]
                                 target_block = block_map[target_name]
                                 conn = FIFOConnection(
                                     self.canvas,
                                     source_block,
                                     target_block,
                                     conn_data["name"],
-                                    conn_data["depth"],
+                                    conn_data["qd"],
                                     conn_data["width"],
                                     conn_data.get("src_ch_num", 0),  # Preserve saved channel numbers
-                                    conn_data.get("dst_ch_num", 0)   # Preserve saved channel numbers
+                                    conn_data.get("dst_ch_num", 0),  # Preserve saved channel numbers
+                                    index=self._conn_grid
                                 )
-                                self.connections.append(conn)
-                
+                                self.connections[conn] = None
+                                self._connection_groups = None
+                    
+                    else:
+                        # Old format with connections nested in blocks
+                        for block_data in design_data.get("blocks", []):
+                            source_block = block_map[block_data["name"]]
+                            for conn_data in block_data.get("connections", []):
+                                target_name = conn_data["target"]
+                                if target_name in block_map:
+                                    target_block = block_map[target_name]
+                                    conn = FIFOConnection(
+                                        self.canvas,
+                                        source_block,
+                                        target_block,
+                                        conn_data["name"],
+                                        conn_data["depth"],
+                                        conn_data["width"],
+                                        conn_data.get("src_ch_num", 0),  # Preserve saved channel numbers
+                                        conn_data.get("dst_ch_num", 0),  # Preserve saved channel numbers
+                                        index=self._conn_grid
+                                    )
+                                    self.connections[conn] = None
+                                    self._connection_groups = None
+                    
                 self.status_var.set(f"Loaded from {filename}")
                 messagebox.showinfo("Success", f"Design loaded from:\n{filename}")
                 
@@ -1898,6 +2618,7 @@ class HardwareDesignGUI:
     
     def export_fifo_format(self):
         """Export connections in FIFO format with compact horizontal formatting"""
+        from tkinter import filedialog, messagebox
         if not self.connections:
             messagebox.showinfo("Info", "No connections to export")
             return
@@ -1910,22 +2631,8 @@ class HardwareDesignGUI:
         
         if filename:
             try:
-                # Create fifo_infos array
-                fifo_infos = []
-                for conn in self.connections:
-                    fifo_data = {
-                        "name": conn.name,
-                        "src": conn.source_block.name,
-                        "src_ch_num": conn.src_ch_num,
-                        "dst": conn.target_block.name,
-                        "dst_ch_num": conn.dst_ch_num,
-                        "qd": conn.depth,
-                        "width": conn.width
-                    }
-                    fifo_infos.append(fifo_data)
-                
                 data = {
-                    "fifo_infos": fifo_infos
+                    "fifo_infos": self._fifo_infos()
                 }
                 
                 # Write with compact formatting
@@ -1940,6 +2647,7 @@ class HardwareDesignGUI:
     
     def import_fifo_format(self):
         """Import connections from FIFO format"""
+        from tkinter import filedialog, messagebox
         filename = filedialog.askopenfilename(
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
             title="Import FIFO Format"
@@ -1947,8 +2655,7 @@ class HardwareDesignGUI:
         
         if filename:
             try:
-                with open(filename, 'r') as f:
-                    data = json.load(f)
+                data = _read_json_file(filename)
                 
                 if "fifo_infos" not in data:
                     messagebox.showerror("Error", "Invalid FIFO format: 'fifo_infos' key not found")
@@ -1963,53 +2670,70 @@ class HardwareDesignGUI:
                     block_names.add(fifo_info["src"])
                     block_names.add(fifo_info["dst"])
                 
-                # Create blocks in a grid layout
+                # Create blocks in a grid layout with a local lookup, as in load_json
                 block_map = {}
-                cols = math.ceil(math.sqrt(len(block_names)))
+                self._block_by_name = None
+                # Smallest square grid that fits every block, in exact integer math
+                cols = math.isqrt(len(block_names) - 1) + 1 if block_names else 1
                 x_offset = 50
                 y_offset = 50
                 
                 for i, block_name in enumerate(sorted(block_names)):
-                    x = x_offset + (i % cols) * 200
-                    y = y_offset + (i // cols) * 150
+                    row, col = divmod(i, cols)
+                    x = x_offset + col * 200
+                    y = y_offset + row * 150
                     
-                    block = Block(self.canvas, x, y, name=block_name, number=i + 1)
+                    block = Block(self.canvas, x, y, name=block_name, number=i + 1, index=self._block_items)
                     self.blocks.append(block)
                     block_map[block_name] = block
                 
-                # Create connections
-                for fifo_info in data["fifo_infos"]:
-                    src_name = fifo_info["src"]
-                    dst_name = fifo_info["dst"]
-                    
-                    if src_name in block_map and dst_name in block_map:
-                        source_block = block_map[src_name]
-                        target_block = block_map[dst_name]
-                        
-                        # Check connection limits
-                        if not (source_block.can_add_connection() and target_block.can_add_connection()):
-                            messagebox.showwarning("Warning", 
-                                f"Skipping connection {fifo_info['name']}: connection limit exceeded")
-                            continue
+                # Free connection slots per block, counted down as connections are created
+                connections_left = dict.fromkeys(self.blocks, Block.max_connections)
+                warnings = []  # Shown together once the import is done
+                with self.batch_redraw():
+                    # Create connections
+                    for fifo_info in data["fifo_infos"]:
+                        src_name = fifo_info["src"]
+                        dst_name = fifo_info["dst"]
                         
-                        conn = FIFOConnection(
-                            self.canvas,
-                            source_block,
-                            target_block,
-                            fifo_info["name"],
-                            fifo_info["qd"],
-                            fifo_info["width"],
-                            fifo_info["src_ch_num"],  # Preserve imported channel numbers
-                            fifo_info["dst_ch_num"]   # Preserve imported channel numbers
-                        )
-                        self.connections.append(conn)
+                        if src_name in block_map and dst_name in block_map:
+                            source_block = block_map[src_name]
+                            target_block = block_map[dst_name]
+                            
+                            # Check connection limits
+                            if connections_left[source_block] <= 0 or connections_left[target_block] <= 0:
+                                warnings.append(f"Skipping connection {fifo_info['name']}: connection limit exceeded")
+                                continue
+                            
+                            connections_left[source_block] -= 1
+                            connections_left[target_block] -= 1
+                            
+                            conn = FIFOConnection(
+                                self.canvas,
+                                source_block,
+                                target_block,
+                                fifo_info["name"],
+                                fifo_info["qd"],
+                                fifo_info["width"],
+                                fifo_info["src_ch_num"],  # Preserve imported channel numbers
+                                fifo_info["dst_ch_num"],  # Preserve imported channel numbers
+                                index=self._conn_grid
+                            )
+                            self.connections[conn] = None
+                            self._connection_groups = None
                 
-                self.status_var.set(f"Imported FIFO format from {filename}")
-                messagebox.showinfo("Success", 
-                    f"FIFO format imported from:\n{filename}\n\n"
-                    f"Created {len(self.blocks)} blocks and {len(self.connections)} connections")
+                if warnings:
+                    warning_lines = warnings[:10]
+                    if len(warnings) > 10:
+                        warning_lines.append(f"... and {len(warnings) - 10} more warnings")
+                    messagebox.showwarning("Warning", "\n".join(warning_lines))
+                    
+                # Report without a modal dialog; the status bar keeps the message
+                block_count, connection_count = len(self.blocks), len(self.connections)
+                self._toast(f"Imported FIFO format from {filename}: created {block_count} blocks and {connection_count} connections")
                 
-            except Exception as e:
+            # Unreadable file, invalid JSON or entries of the wrong shape; anything else is a bug
+            except (OSError, ValueError, KeyError, TypeError) as e:
                 messagebox.showerror("Error", f"Failed to import FIFO format: {str(e)}")
     
     def toggle_debug_mode(self):
@@ -2018,170 +2742,86 @@ class HardwareDesignGUI:
         status = "enabled" if self.debug_mode else "disabled"
         self.status_var.set(f"Debug mode {status}")
     
+    def toggle_labels(self):
+        """Show or hide the FIFO name labels on connections"""
+        FIFOConnection.show_labels = not FIFOConnection.show_labels
+        for conn in self.connections:
+            conn.draw()
+        
+        self.labels_button.configure(text="Hide Labels" if FIFOConnection.show_labels else "Show Labels")
+        status = "shown" if FIFOConnection.show_labels else "hidden"
+        self.status_var.set(f"Connection labels {status}")
+    
     def show_help(self):
         """Show help guide"""
-        help_window = tk.Toplevel(self.root)
-        help_window.title("Hardware Design Tool - Help Guide")
-        help_window.geometry("800x700")
-        help_window.transient(self.root)
+        # Reopen the existing window rather than building and filling a new one
+        if self._help_window is not None and self._help_window.winfo_exists():
+            self._help_window.deiconify()
+            self._help_window.lift()
+            return
+        
+        # Keep the window unmapped until its contents exist so it is laid out once
+        help_window = self._help_window = tk.Toplevel(self.root)
+        help_window.withdraw()
         
         # Create scrollable text widget
         text_frame = ttk.Frame(help_window)
         text_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         text_widget = tk.Text(text_frame, wrap=tk.WORD, font=("Consolas", 10))
-        scrollbar = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=text_widget.yview)
-        text_widget.configure(yscrollcommand=scrollbar.set)
+        # Linked through Tcl command strings, like the main canvas scrollbars
+        scrollbar = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=f"{text_widget} yview")
+        text_widget.configure(yscrollcommand=f"{scrollbar} set")
         
-        help_text = """HARDWARE DESIGN TOOL - HELP GUIDE
-
-=== CREATING BLOCKS ===
-• Click "Add Block" or press Ctrl+N
-• Enter a name for your hardware module
-• Set block numbers manually via Properties (right-click → Properties)
-• Move blocks by clicking and dragging
-• Resize blocks by dragging the orange handle in bottom-right corner
-
-=== BLOCK NUMBERING ===
-• Block numbers are optional and user-defined
-• Edit block number via Properties dialog (right-click → Properties)
-• Leave number field empty for no number display
-• Numbers help organize large designs
-
-=== BLOCK SIZING OPTIONS ===
-• Manual resize: Drag the orange handle on selected blocks
-• Quick resize buttons: S (Small), M (Medium), L (Large), XL (Extra Large)
-• Select a block first, then click size buttons in toolbar
-
-=== CONNECTING BLOCKS (Multiple Ways) ===
-
-Method 1 - Drag to Connect (Easiest):
-• Click "Connect Mode" or press Ctrl+C
-• Click and drag from source block to target block
-• Visual feedback shows temporary connection line
-• Creates connection automatically when you release
-• Channel numbers assigned automatically (0, 1, 2, ...)
-
-Method 2 - Right-Click Quick Connect (Fastest):
-• Right-click on any block
-• Select "Quick Connect to →" and choose target
-• Or select "Connect from [BlockName]..." for step-by-step
-
-=== AUTOMATIC CHANNEL ASSIGNMENT ===
-• Source and destination channel numbers assigned automatically
-• Uses lowest available channel number for each block
-• Example: Block with channels 0,1,3 → next connection gets channel 2
-• Preserves manual assignments when loading saved files
-• "Reassign All Channels" button to reset all channel numbers
-
-=== FIFO CONNECTION DISPLAY ===
-• FIFO connections show only the FIFO name for clarity
-• View all properties in "Connection Info" dialog
-• Edit properties by double-clicking or right-clicking connections
-• Status bar shows channel assignments when connections created
-
-=== MULTIPLE CONNECTIONS ===
-• Up to 15 connections per block supported
-• Multiple FIFOs between same blocks automatically:
-  - Separated visually with curves
-  - Named uniquely (FIFO, FIFO_2, FIFO_3, etc.)
-  - Spread along block edges to avoid overlap
-  - Each gets unique channel numbers automatically
-
-=== INFORMATION TABS ===
-
-Block Info Tab:
-• View all blocks with numbers, names, positions, sizes
-• See connection counts for each block (X/15)
-• Renumber all blocks sequentially
-• Edit selected block properties directly
-
-Connection Info Tab (Interactive):
-• Columns: FIFO Name, Source, Src CH, Destination, Dst CH, Depth, Width
-• Grouped by block pairs for better organization
-• Double-click any connection to edit properties
-• "Edit Selected Connection" button for property editing
-• "Reassign All Channels" to reset channel numbering
-• Export/Import connections to/from JSON
-
-=== JSON CONNECTION EXPORT/IMPORT ===
-• Export connections: Save all FIFO connections to JSON file
-• Import connections: Load connections from JSON to existing blocks
-• Preserves all connection properties including channel numbers
-• Useful for sharing connection configurations
-• Access via Connection Info tab or File menu
-
-=== EDITING PROPERTIES ===
-• Double-click any block or connection
-• Right-click and select "Properties"
-• Select item and press F2
-• Connection properties: name, depth, width, channel numbers (manual override)
-• Block properties: name, width, height, number (optional)
-
-=== SELECTION AND DELETION ===
-• Left-click to select blocks or connections
-• Press Delete key to remove selected items
-• Right-click for context menus with quick actions
-
-=== DEBUG MODE ===
-• Click "Debug" button to toggle debug output on/off
-• Helpful for troubleshooting interaction issues
-• Shows detailed click, drag, and selection information
-
-=== KEYBOARD SHORTCUTS ===
-• Ctrl+N: Add new block
-• Ctrl+C: Toggle connect mode
-• Ctrl+S: Save design
-• Ctrl+O: Load design
-• Delete: Remove selected item
-• F2: Edit properties
-• Escape: Cancel operations
-
-=== FILE OPERATIONS ===
-• Save/Load Design: Full design with blocks, connections, and numbers
-• Export/Import Connections: Just connection data in JSON format
-• Export/Import FIFO Format: For external tools
-• All formats preserve block numbers and connection properties
-
-=== TIPS FOR BETTER PRODUCTIVITY ===
-• Use block numbers for large designs (edit via Properties)
-• Use larger blocks (L or XL) for complex designs
-• Export connections as JSON templates for reuse
-• Connect Mode + drag is fastest for multiple connections
-• Channel numbers assigned automatically - no manual setup needed
-• Use "Reassign All Channels" if channel numbering gets messy
-• Right-click is your friend for quick operations
-• Block Info and Connection Info tabs help manage complex designs
-• Double-click connections in Connection Info for quick editing
-• Use Debug mode if you encounter interaction issues"""
+        # Insert the first screenful right away and append the rest from idle
+        # callbacks, so the window paints before the whole guide is laid out
+        lines = _HELP_TEXT.splitlines(keepends=True)
+        chunks = ["".join(lines[i:i + _HELP_CHUNK_LINES]) for i in range(0, len(lines), _HELP_CHUNK_LINES)]
         
-        text_widget.insert(tk.END, help_text)
-        text_widget.configure(state=tk.DISABLED)  # Make read-only
+        def append_chunk(i):
+            if not text_widget.winfo_exists():
+                return
+            text_widget.configure(state=tk.NORMAL)
+            text_widget.insert(tk.END, chunks[i])
+            text_widget.configure(state=tk.DISABLED)  # Make read-only
+            if i + 1 < len(chunks):
+                help_window.after_idle(append_chunk, i + 1)
         
-        text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        append_chunk(0)
         
-        # Close button
-        ttk.Button(help_window, text="Close", command=help_window.destroy).pack(pady=10)
+        # Text stretches with the window; the scrollbar only grows vertically
+        text_frame.rowconfigure(0, weight=1)
+        text_frame.columnconfigure(0, weight=1)
+        text_widget.grid(row=0, column=0, sticky="nsew")
+        scrollbar.grid(row=0, column=1, sticky="ns")
+        
+        # Closing only hides the window so it can be shown again as is
+        help_window.protocol("WM_DELETE_WINDOW", help_window.withdraw)
+        ttk.Button(help_window, text="Close", command=help_window.withdraw).pack(pady=10)
+        
+        help_window.title("Hardware Design Tool - Help Guide")
+        help_window.geometry("800x700")
+        help_window.transient(self.root)
+        help_window.deiconify()
     
     def show_about(self):
         """Show about dialog"""
-        about_text = """Hardware Design Tool
-Block Diagram Editor
-
-Version 1.0
-
-Features:
-• Visual block diagram creation
-• Automatic FIFO connection management
-• Multiple connection types between blocks
-• JSON export/import functionality
-• Interactive property editing
-• Automatic channel assignment
-
-Created for hardware design workflows."""
+        # Reopen the existing window rather than building a new one
+        if self._about_window is not None and self._about_window.winfo_exists():
+            self._about_window.deiconify()
+            self._about_window.lift()
+            return
+        
+        about_window = self._about_window = tk.Toplevel(self.root)
+        about_window.title("About Hardware Design Tool")
+        about_window.transient(self.root)
+        about_window.resizable(False, False)
+        
+        ttk.Label(about_window, text=_ABOUT_TEXT, justify=tk.LEFT).pack(padx=20, pady=(20, 10))
         
-        messagebox.showinfo("About Hardware Design Tool", about_text)
+        # Closing only hides the window so it can be shown again as is
+        about_window.protocol("WM_DELETE_WINDOW", about_window.withdraw)
+        ttk.Button(about_window, text="Close", command=about_window.withdraw).pack(pady=(0, 15))
     
     def run(self):
         """Start the application"""